@@ -38,6 +38,8 @@ CUSTOM_GESTURE_THRESHOLD = 0.75  # Confidence threshold for custom gestures
 # ============================================================
 COMMAND_DURATION = 2.0
 COOLDOWN_TIME = 1.0
+COMMAND_SEND_INTERVAL_MS = 20  # Minimum gap between writes (firmware loop period)
+COMMAND_QUEUE_SIZE = 8  # Oldest queued commands are dropped beyond this
 
 # ============================================================
 #                    ROBOT COMMANDS
@@ -59,7 +61,10 @@ WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 800
 VIDEO_WIDTH = 800
 VIDEO_HEIGHT = 600
+VIDEO_DISPLAY_FPS = 30  # Camera feed frames shown per second at most
 MAX_LOG_LINES = 1000  # Maximum log lines to keep in memory
+LOG_FLUSH_INTERVAL_MS = 75  # Batch log lines into the log view this often
+INDICATOR_UPDATE_INTERVAL_MS = 100  # Max rate of voice/gesture indicator updates
 
 # Control modes
 MODE_KEYBOARD = "KEYBOARD"
@@ -131,4 +136,7 @@ VOICE_MODEL_DIR = "resources/sound_classifier"
 GESTURE_MODEL_DIR = "resources/gesture_classifier"
 
 # Mapping storage
-MAPPINGS_DIR = "model_mappings"
\ No newline at end of file
+MAPPINGS_DIR = "model_mappings"
+
+# TFLite inference
+TFLITE_XNNPACK_DELEGATE = None  # Path to an external XNNPACK delegate library; None uses the runtime's built-in XNNPACK
\ No newline at end of file
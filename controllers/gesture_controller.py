@@ -211,7 +211,7 @@ class GestureController(BaseController):
             print("Camera released")
         
         # Clear the video display
-        self.signals.frame_signal.emit(None)
+        self.signals.emit_frame(None)
         
         self.signals.log_signal.emit("Gesture recognition stopped", "info")
 
@@ -316,7 +316,7 @@ class GestureController(BaseController):
                 # Send frame to UI (only if still active)
                 if self.active:
                     try:
-                        self.signals.frame_signal.emit(frame)
+                        self.signals.emit_frame(frame)
                     except Exception as e:
                         if self.active:
                             print(f"Frame signal error: {e}")
@@ -339,7 +339,7 @@ class GestureController(BaseController):
         
         # Ensure we emit None when loop exits
         try:
-            self.signals.frame_signal.emit(None)
+            self.signals.emit_frame(None)
         except Exception:
             pass
         print("Gesture recognition loop exited")
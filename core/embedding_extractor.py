@@ -4,10 +4,10 @@ Extracts feature vectors from TFLite models without classification.
 """
 
 import numpy as np
-import tflite_runtime.interpreter as tflite
 from PIL import Image, ImageOps
 
 from config import GESTURE_IMAGE_SIZE
+from utils.tflite_compat import get_tflite_interpreter
 
 
 class EmbeddingExtractor:
@@ -17,12 +17,13 @@ class EmbeddingExtractor:
         self.model_path = model_path
         self.interpreter = None
         self.embedding_layer_index = None
+        self.dim = None  # Length of the flattened embedding vector
         self._load_model()
     
     def _load_model(self):
         """Load TFLite model and find embedding layer."""
         try:
-            self.interpreter = tflite.Interpreter(self.model_path)
+            self.interpreter = get_tflite_interpreter(self.model_path)
             self.interpreter.allocate_tensors()  # CRITICAL: Allocate first
             
             # Get output details - use the main output layer
@@ -31,6 +32,7 @@ class EmbeddingExtractor:
             # For most models, just use the output layer itself as "embeddings"
             # This works fine for similarity comparison
             self.embedding_layer_index = output_details[0]['index']
+            self.dim = int(np.prod(output_details[0]['shape']))
             
             print(f"EmbeddingExtractor loaded successfully, using output index: {self.embedding_layer_index}")
         
@@ -122,7 +124,7 @@ class CustomGestureManager:
         
         Args:
             name: Gesture name
-            embeddings: List of embedding vectors
+            embeddings: Embedding vectors (list or 2-D array, one row each)
             letter: Assigned letter
         """
         self.custom_gestures[name] = {
@@ -3,8 +3,13 @@ Main robot controller backend.
 """
 
 import threading
+from collections import deque
 
-from config import MODE_KEYBOARD, MODE_VOICE, MODE_GESTURE
+from PySide6.QtCore import QTimer
+
+from config import (MODE_KEYBOARD, MODE_VOICE, MODE_GESTURE, STOP_DRIVE, STOP_ARM1,
+                    STOP_ARM2, STOP_ARM3, STOP_ALL, COMMAND_SEND_INTERVAL_MS,
+                    COMMAND_QUEUE_SIZE)
 from .bluetooth_manager import BluetoothManager
 from .command_executor import CommandExecutor
 from .profile_manager import ProfileManager
@@ -12,6 +17,9 @@ from controllers import VoiceController, GestureController
 from ui.theme_manager import ThemeManager
 
 
+_STOP_COMMANDS = frozenset((STOP_DRIVE, STOP_ARM1, STOP_ARM2, STOP_ARM3, STOP_ALL))
+
+
 class RobotControllerBackend:
     """Main backend controller managing robot communication and control modes."""
     
@@ -41,6 +49,13 @@ class RobotControllerBackend:
             'arm3': None
         }
         
+        # Outbound command queue, drained no faster than the firmware loop
+        # (bounded by COMMAND_QUEUE_SIZE in send_command, never dropping stops)
+        self._cmd_queue = deque()
+        self._cmd_timer = QTimer()
+        self._cmd_timer.setInterval(COMMAND_SEND_INTERVAL_MS)
+        self._cmd_timer.timeout.connect(self._drain_command_queue)
+        
         self._log_availability()
         self._load_last_profiles()
     
@@ -96,11 +111,53 @@ class RobotControllerBackend:
                 self.gesture_controller.model.set_mapping(DEFAULT_GESTURE_MAPPING)
                 self.signals.log_signal.emit("Using default gesture mappings", "info")
     def send_command(self, command):
-        """Send command to robot."""
-        self.executor.send_command(command)
+        """
+        Queue command for the robot.
+        
+        Commands are written at most once every COMMAND_SEND_INTERVAL_MS so
+        bursts of button/key events don't overrun the firmware. A command
+        sent while the link is idle goes out immediately. When the queue is
+        full the oldest motion command is dropped; stop commands never are.
+        STOP_ALL skips the queue entirely (see stop_all_motors).
+        
+        Args:
+            command: Command character
+        """
+        if command == STOP_ALL:
+            # Emergency stop: don't wait behind queued motion commands
+            self.stop_all_motors()
+            return
+        
+        if (command in _STOP_COMMANDS and self._cmd_queue
+                and self._cmd_queue[-1] == command):
+            return  # Several buttons released at once
+        
+        if len(self._cmd_queue) >= COMMAND_QUEUE_SIZE:
+            # Make room by dropping the oldest motion command; stop commands
+            # are never dropped or the motor would keep running
+            for i, queued in enumerate(self._cmd_queue):
+                if queued not in _STOP_COMMANDS:
+                    del self._cmd_queue[i]
+                    break
+            else:
+                if command not in _STOP_COMMANDS:
+                    return  # Queue holds only stops; they go first
+        
+        self._cmd_queue.append(command)
+        if not self._cmd_timer.isActive():
+            self._drain_command_queue()
+            self._cmd_timer.start()
+    
+    def _drain_command_queue(self):
+        """Write the next queued command, stopping the timer once idle."""
+        if self._cmd_queue:
+            self.executor.send_command(self._cmd_queue.popleft())
+        else:
+            self._cmd_timer.stop()
     
     def stop_all_motors(self):
-        """Stop all motors."""
+        """Stop all motors immediately, discarding any queued commands."""
+        self._cmd_queue.clear()
         self.executor.stop_all_motors()
         self.active_cmds = {k: None for k in self.active_cmds}
         if self.gesture_controller.active:
@@ -128,7 +185,7 @@ class RobotControllerBackend:
             elif self.current_mode == MODE_GESTURE:
                 self.gesture_controller.stop()
                 # Clear video feed when leaving gesture mode
-                self.signals.frame_signal.emit(None)
+                self.signals.emit_frame(None)
             
             # Start new mode
             self.current_mode = new_mode
@@ -140,13 +197,14 @@ class RobotControllerBackend:
                 self.gesture_controller.start()
             else:
                 # Switching to keyboard mode - ensure camera is cleared
-                self.signals.frame_signal.emit(None)
+                self.signals.emit_frame(None)
             
             self.signals.log_signal.emit(f"Now in {new_mode} mode", "success")
 
     def cleanup(self):
         """Cleanup all resources."""
         self.running = False
+        self._cmd_timer.stop()
         self.stop_all_motors()
         
         # Save current profiles before cleanup
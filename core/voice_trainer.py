@@ -19,6 +19,54 @@ class VoiceTrainer:
         self.duration = VOICE_TRAINING_DURATION
         self.recording = False
         self.current_recording = None
+        self.stream = None  # Input stream kept open by open_stream()
+    
+    def open_stream(self):
+        """
+        Open the default input device once for repeated recordings.
+        
+        The stream is left stopped between samples; record_from_stream()
+        starts it for each sample so no stale audio is buffered.
+        """
+        if self.stream is not None:
+            return
+        if sd.default.device[0] is None:
+            raise Exception("No default input device found. Please configure your microphone.")
+        self.stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype='float32'
+        )
+        if DEBUG:
+            print(f"DEBUG: Opened input stream on device {self.stream.device}")
+    
+    def record_from_stream(self):
+        """
+        Record a voice sample from the stream opened by open_stream().
+        
+        Returns:
+            Numpy array of audio data
+        """
+        if self.stream is None:
+            self.open_stream()
+        
+        self.stream.start()
+        try:
+            audio_data, overflowed = self.stream.read(int(self.duration * self.sample_rate))
+        finally:
+            self.stream.stop()
+        if DEBUG and overflowed:
+            print("DEBUG: Input overflow while recording sample")
+        
+        if audio_data is None or len(audio_data) == 0:
+            raise Exception("No audio data recorded. Check microphone connection.")
+        return audio_data.flatten()
+    
+    def close_stream(self):
+        """Close the stream opened by open_stream()."""
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
     
     def record_sample(self):
         """
@@ -177,7 +225,7 @@ class CustomVoiceManager:
         
         Args:
             name: Voice command name
-            embeddings: List of embedding vectors
+            embeddings: Embedding vectors (list or 2-D array, one row each)
             letter: Assigned letter
         """
         self.custom_voices[name] = {
@@ -4,9 +4,9 @@ Voice recognition model handler.
 
 import os
 import numpy as np
-import tflite_runtime.interpreter as tflite
 
 from utils.resource_loader import resource_path
+from utils.tflite_compat import get_tflite_interpreter
 
 
 class VoiceModel:
@@ -49,7 +49,7 @@ class VoiceModel:
             raise FileNotFoundError(f"Voice labels not found: {labels_path}")
         
         try:
-            self.interpreter = tflite.Interpreter(model_path)
+            self.interpreter = get_tflite_interpreter(model_path)
             self.interpreter.allocate_tensors()
             
             # Get buffer size from model input shape
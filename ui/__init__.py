@@ -2,15 +2,31 @@
 User interface components.
 """
 
+import importlib
+
 from .signal_emitter import SignalEmitter
 from .main_window import RobotControlUI
-from .model_config_dialog import ModelConfigDialog
-from .custom_gesture_dialog import CustomGestureDialog
-from .custom_voice_dialog import CustomVoiceDialog
-from .profile_manager_dialog import ProfileManagerDialog
 from .theme_manager import ThemeManager
-from .virtual_bt_monitor import VirtualBluetoothMonitor
-from .configuration_dialog import ConfigurationDialog
+
+# Dialogs are only imported when first accessed (PEP 562), so importing
+# the package at startup does not load them
+_LAZY = {
+    'ModelConfigDialog': '.model_config_dialog',
+    'CustomGestureDialog': '.custom_gesture_dialog',
+    'CustomVoiceDialog': '.custom_voice_dialog',
+    'ProfileManagerDialog': '.profile_manager_dialog',
+    'VirtualBluetoothMonitor': '.virtual_bt_monitor',
+    'ConfigurationDialog': '.configuration_dialog',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ['SignalEmitter', 'RobotControlUI', 'ModelConfigDialog', 
            'CustomGestureDialog', 'CustomVoiceDialog', 'ProfileManagerDialog', 
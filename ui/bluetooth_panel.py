@@ -2,14 +2,25 @@
 Bluetooth connection panel UI component.
 """
 
+import os
 import re
+import asyncio
+import logging
+import select
 import subprocess
 import time
 import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PySide6.QtWidgets import (QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, 
-                               QPushButton, QListWidget, QSpinBox, QMessageBox)
-from PySide6.QtCore import Signal, Slot
+                               QPushButton, QListWidget, QListWidgetItem, QMessageBox,
+                               QCheckBox)
+from PySide6.QtCore import Qt, Signal, Slot, QThreadPool
+
+from config import DEFAULT_RFCOMM_CHANNEL
+
+log = logging.getLogger(__name__)
 
 # Try importing bluetooth, handle if not available
 try:
@@ -17,7 +28,96 @@ try:
     BLUETOOTH_AVAILABLE = True
 except ImportError:
     BLUETOOTH_AVAILABLE = False
-    print("WARNING: PyBluez not available. Bluetooth scanning will not work.")
+    log.warning("PyBluez not available. Bluetooth scanning will not work.")
+
+# Try importing dbus-fast for direct BlueZ queries, fall back to bluetoothctl
+try:
+    from dbus_fast import BusType, Message, MessageType, Variant
+    from dbus_fast.aio import MessageBus
+    DBUS_AVAILABLE = True
+except ImportError:
+    DBUS_AVAILABLE = False
+
+BLUEZ_SERVICE = "org.bluez"
+BLUEZ_ADAPTER_PATH = "/org/bluez/hci0"
+BLUEZ_ADAPTER_IFACE = "org.bluez.Adapter1"
+BLUEZ_DEVICE_IFACE = "org.bluez.Device1"
+OBJECT_MANAGER_IFACE = "org.freedesktop.DBus.ObjectManager"
+PROPERTIES_IFACE = "org.freedesktop.DBus.Properties"
+SPP_UUID = "1101"  # Serial Port profile service class
+
+DISCOVERY_DURATION = 8  # seconds
+QUICK_DISCOVERY_DURATION = 2  # seconds
+QUICK_RESCAN_WINDOW = 30  # seconds since the last full scan
+PAIRED_CACHE_TTL = 5.0  # seconds
+BTCTL_TIMEOUT = 10  # seconds
+
+_STYLE_ERROR = "color: #ff4444; font-weight: bold;"
+_STYLE_BUSY = "color: #ffaa00; font-weight: bold;"
+_STYLE_OK = "color: #00ff88; font-weight: bold;"
+_STYLE_VIRTUAL = "color: #6495ED; font-weight: bold;"
+
+_MAC_RE = re.compile(r'^(?:[0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}$')
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]|\x01|\x02')
+# One "paired-devices" reply line, optionally after the interactive prompt
+_PAIRED_LINE_RE = re.compile(r'^(?:\[[^\]]*\]# )?Device ([0-9A-F:]{17}) (.+)$')
+# Asynchronous event lines ("[NEW] Device ...", "[CHG] Device ... RSSI: ...")
+_EVENT_PREFIXES = ("[NEW]", "[CHG]", "[DEL]")
+
+
+async def _get_managed_objects(bus):
+    """Return BlueZ's object tree as {path: {interface: {prop: Variant}}}."""
+    introspection = await bus.introspect(BLUEZ_SERVICE, "/")
+    proxy = bus.get_proxy_object(BLUEZ_SERVICE, "/", introspection)
+    manager = proxy.get_interface(OBJECT_MANAGER_IFACE)
+    return await manager.call_get_managed_objects()
+
+
+async def _get_adapter(bus):
+    """Return the org.bluez.Adapter1 interface of the default adapter."""
+    introspection = await bus.introspect(BLUEZ_SERVICE, BLUEZ_ADAPTER_PATH)
+    proxy = bus.get_proxy_object(BLUEZ_SERVICE, BLUEZ_ADAPTER_PATH, introspection)
+    return proxy.get_interface(BLUEZ_ADAPTER_IFACE)
+
+
+async def _add_match(bus, rule):
+    """Ask the bus daemon to route signals matching ``rule`` to us."""
+    await bus.call(Message(
+        destination="org.freedesktop.DBus",
+        path="/org/freedesktop/DBus",
+        interface="org.freedesktop.DBus",
+        member="AddMatch",
+        signature="s",
+        body=[rule],
+    ))
+
+
+def _spp_channels(services):
+    """Return the RFCOMM channels of Serial Port services in SDP results.
+    
+    Args:
+        services: Records from bluetooth.find_service()
+        
+    Returns:
+        List of channel numbers, empty if the device advertises no SPP service.
+    """
+    channels = []
+    for svc in services:
+        classes = [c.upper() for c in svc.get("service-classes", [])]
+        is_spp = any(c == SPP_UUID or c.startswith(f"0000{SPP_UUID}-") for c in classes)
+        if is_spp and svc.get("port") is not None and svc["port"] not in channels:
+            channels.append(svc["port"])
+    return channels
+
+
+def _device_from_props(props):
+    """Build a device entry from org.bluez.Device1 properties."""
+    name = props.get("Name") or props.get("Alias")
+    return {
+        "name": name.value if name else "Unknown Device",
+        "mac": props["Address"].value,
+        "channels": [],  # resolved lazily on selection
+    }
 
 
 class BluetoothPanel(QGroupBox):
@@ -25,24 +125,51 @@ class BluetoothPanel(QGroupBox):
     
     # Custom signals for thread-safe UI updates
     devices_found = Signal(list)
+    device_discovered = Signal(dict)
+    channels_resolved = Signal(str)
     scan_error_signal = Signal(str)
     connection_failed_signal = Signal(str)
+    connected_signal = Signal(str)
     
     def __init__(self, backend, signal_emitter, parent=None):
         super().__init__("Bluetooth Setup", parent)
         self.backend = backend
         self.signals = signal_emitter
         self.discovered_devices = []
+        self._dev_by_mac = {}
         self.selected_mac = None
+        self._connecting = False  # A connect_direct attempt is in flight
+        self._paired_cache = None
+        self._paired_cache_ts = 0.0
+        self._btctl = None
+        self._btctl_lock = threading.Lock()
+        self._last_scan_devices = []
+        self._last_scan_ts = 0.0
+        self._watch_thread = None
+        self._watch_loop = None  # Event loop of the paired-device watcher
+        self._watch_stop = None  # Future ending the watcher, set by shutdown()
+        self._shutting_down = False
+        
+        # Short-lived background jobs (scans, SDP lookups, connects)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(4)
         
         self._init_ui()
         
         # Connect internal signals to slots
         self.devices_found.connect(self._update_scan_result)
+        self.device_discovered.connect(self._add_scan_result)
+        self.channels_resolved.connect(self._update_channels)
         self.scan_error_signal.connect(self._scan_error)
         self.connection_failed_signal.connect(self._connection_failed)
+        self.connected_signal.connect(self._connected)
         
-        print("BluetoothPanel initialized")
+        if DBUS_AVAILABLE:
+            # Runs for the panel's lifetime, so it gets its own thread
+            self._watch_thread = threading.Thread(target=self._watch_paired_thread, daemon=True)
+            self._watch_thread.start()
+        
+        log.debug("BluetoothPanel initialized")
     
     def _init_ui(self):
             """Initialize UI components."""
@@ -50,7 +177,8 @@ class BluetoothPanel(QGroupBox):
             
             # Status label
             self.bt_status = QLabel("Status: Not connected")
-            self.bt_status.setStyleSheet("color: #ff4444; font-weight: bold;")
+            self.bt_status.setStyleSheet(_STYLE_ERROR)
+            self._status_style = _STYLE_ERROR
             layout.addWidget(self.bt_status)
             
             # Virtual connection button (toggle)
@@ -73,6 +201,13 @@ class BluetoothPanel(QGroupBox):
             
             layout.addLayout(btn_layout)
             
+            self.full_rescan_check = QCheckBox("Force full rescan")
+            self.full_rescan_check.setToolTip(
+                f"Repeat scans within {QUICK_RESCAN_WINDOW} s do a short inquiry "
+                "and keep earlier results. Tick to always do a full scan."
+            )
+            layout.addWidget(self.full_rescan_check)
+            
             # Device list
             self.bt_list = QListWidget()
             self.bt_list.itemClicked.connect(self.select_bt_device)
@@ -86,156 +221,212 @@ class BluetoothPanel(QGroupBox):
             
             self.setLayout(layout)
     
+    def _set_status(self, text, style):
+        """Update the status label, restyling it only when the style changes."""
+        self.bt_status.setText(text)
+        if style != self._status_style:
+            self.bt_status.setStyleSheet(style)
+            self._status_style = style
+    
+    @Slot()
     def toggle_virtual(self):
             """Toggle virtual Bluetooth connection."""
             if self.virtual_btn.isChecked():
                 # Connect
-                print("Connecting virtual...")
-                self.bt_status.setText("Connecting virtual...")
-                self.bt_status.setStyleSheet("color: #ffaa00; font-weight: bold;")
+                log.debug("Connecting virtual...")
+                self._set_status("Connecting virtual...", _STYLE_BUSY)
                 
                 try:
                     success = self.backend.bluetooth.connect_virtual()
-                    print(f"Virtual connection result: {success}")
+                    log.debug("Virtual connection result: %s", success)
                     
                     if success:
-                        self.bt_status.setText("VIRTUAL MODE - Simulation Active")
-                        self.bt_status.setStyleSheet("color: #6495ED; font-weight: bold;")
+                        self._set_status("VIRTUAL MODE - Simulation Active", _STYLE_VIRTUAL)
                         self.signals.log_signal.emit("Virtual Bluetooth ready for testing", "success")
                         self.virtual_btn.setText("🔌 Disconnect Virtual")
                     else:
-                        self.bt_status.setText("Virtual connection failed")
-                        self.bt_status.setStyleSheet("color: #ff4444; font-weight: bold;")
+                        self._set_status("Virtual connection failed", _STYLE_ERROR)
                         self.virtual_btn.setChecked(False)
                 except Exception as e:
-                    print(f"Error in toggle_virtual: {e}")
+                    log.error("Error in toggle_virtual: %s", e)
                     self.signals.log_signal.emit(f"Virtual connection error: {e}", "error")
                     self.virtual_btn.setChecked(False)
             else:
                 # Disconnect
-                print("Disconnecting virtual...")
+                log.debug("Disconnecting virtual...")
                 self.backend.bluetooth.disconnect()
-                self.bt_status.setText("Status: Not connected")
-                self.bt_status.setStyleSheet("color: #ff4444; font-weight: bold;")
+                self._set_status("Status: Not connected", _STYLE_ERROR)
                 self.signals.log_signal.emit("Virtual Bluetooth disconnected", "info")
                 self.virtual_btn.setText("🔧 Connect Virtual (Testing Mode)")
     
+    @Slot()
     def scan_bluetooth_devices(self):
         """Start Bluetooth device discovery."""
-        print("scan_bluetooth_devices called")
+        log.debug("scan_bluetooth_devices called")
         
-        if not BLUETOOTH_AVAILABLE:
+        if not BLUETOOTH_AVAILABLE and not DBUS_AVAILABLE:
             QMessageBox.warning(
                 self, 
                 "Bluetooth Not Available",
-                "PyBluez library is not installed.\n\n"
-                "Install it with: pip install pybluez\n\n"
+                "Neither dbus-fast nor PyBluez is installed.\n\n"
+                "Install one with: pip install dbus-fast\n\n"
                 "Use 'Show Paired Devices' or 'Virtual Connection' instead."
             )
             return
         
-        self.bt_list.clear()
-        self.bt_status.setText("Scanning for devices...")
-        self.bt_status.setStyleSheet("color: #ffaa00; font-weight: bold;")
+        quick = (not self.full_rescan_check.isChecked()
+                 and time.monotonic() - self._last_scan_ts < QUICK_RESCAN_WINDOW)
+        
+        if quick:
+            # Keep the previous results visible; new devices are appended
+            self._fill_list(self._last_scan_devices)
+        else:
+            self.bt_list.clear()
+        self._set_status("Scanning for devices...", _STYLE_BUSY)
         self.signals.log_signal.emit("Starting Bluetooth discovery...", "info")
         
         # Start discovery in thread
-        thread = threading.Thread(target=self._discover_devices_thread, daemon=True)
-        thread.start()
-        print("Discovery thread started")
+        self._pool.start(partial(self._discover_devices_thread, quick))
+        log.debug("Discovery job queued")
     
-    def _discover_devices_thread(self):
-        """Background thread for device discovery."""
-        print("_discover_devices_thread started")
-        try:
-            self.signals.log_signal.emit("Discovering (≈10 s)...", "info")
-            devices = bluetooth.discover_devices(
-                duration=8, lookup_names=True, flush_cache=True, lookup_class=False
-            )
-            print(f"Found {len(devices)} devices")
+    def _discover_devices_thread(self, quick=False):
+        """Background thread for device discovery.
+        
+        Args:
+            quick: Do a short inquiry without flushing BlueZ's cache and merge
+                the results into the previous scan
+        """
+        log.debug("_discover_devices_thread started (quick=%s)", quick)
+        self.discovered_devices = list(self._last_scan_devices) if quick else []
+        duration = QUICK_DISCOVERY_DURATION if quick else DISCOVERY_DURATION
+        if DBUS_AVAILABLE:
+            try:
+                self.signals.log_signal.emit(f"Discovering ({duration} s)...", "info")
+                asyncio.run(self._discover_devices_dbus(duration, purge=not quick))
+            except Exception as e:
+                log.error("Error in _discover_devices_dbus: %s", e)
+                self.scan_error_signal.emit(str(e))
+                return
             
-            self.discovered_devices = []
+            log.debug("Found %d devices", len(self.discovered_devices))
+            self._finish_scan()
+            return
+        
+        try:
+            self.signals.log_signal.emit(f"Discovering (≈{duration + 2} s)...", "info")
+            known = {d["mac"] for d in self.discovered_devices}
+            devices = [
+                (addr, name) for addr, name in bluetooth.discover_devices(
+                    duration=duration, lookup_names=True, flush_cache=not quick, lookup_class=False
+                )
+                if addr not in known and _MAC_RE.match(addr)
+            ]
+            log.debug("Found %d new devices", len(devices))
             
             if not devices:
-                self.devices_found.emit([])
+                self._finish_scan()
                 return
             
-            for addr, name in devices:
-                try:
-                    services = bluetooth.find_service(address=addr)
-                    channels = [svc["port"] for svc in services if "port" in svc]
-                except Exception as e:
-                    print(f"Error getting services for {addr}: {e}")
-                    channels = []
-                
-                self.discovered_devices.append({
-                    "name": name or "Unknown Device",
-                    "mac": addr,
-                    "channels": channels or [1],
-                })
+            with ThreadPoolExecutor(max_workers=min(8, len(devices))) as ex:
+                futures = {
+                    ex.submit(bluetooth.find_service, address=addr): (addr, name)
+                    for addr, name in devices
+                }
+                for future in as_completed(futures):
+                    addr, name = futures[future]
+                    try:
+                        channels = _spp_channels(future.result())
+                    except Exception as e:
+                        log.warning("Error getting services for %s: %s", addr, e)
+                        channels = []
+                    
+                    dev = {
+                        "name": name or "Unknown Device",
+                        "mac": addr,
+                        "channels": channels or [DEFAULT_RFCOMM_CHANNEL],
+                    }
+                    self.discovered_devices.append(dev)
+                    self.device_discovered.emit(dev)
             
-            print(f"Processed {len(self.discovered_devices)} devices")
-            self.devices_found.emit(self.discovered_devices)
+            log.debug("Processed %d devices", len(self.discovered_devices))
+            self._finish_scan()
         
         except Exception as e:
-            print(f"Error in discovery thread: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in discovery thread: %s", e)
             self.scan_error_signal.emit(str(e))
     
+    def _finish_scan(self):
+        """Record a completed discovery and publish the full device list."""
+        self._last_scan_devices = self.discovered_devices
+        self._last_scan_ts = time.monotonic()
+        self.devices_found.emit(self.discovered_devices)
+    
+    @Slot()
     def show_paired_devices(self):
         """Get paired devices using bluetoothctl."""
-        print("show_paired_devices called")
+        log.debug("show_paired_devices called")
+        
+        if (self._paired_cache is not None
+                and time.monotonic() - self._paired_cache_ts < PAIRED_CACHE_TTL):
+            self.discovered_devices = self._paired_cache
+            self.devices_found.emit(self._paired_cache)
+            return
         
         self.bt_list.clear()
-        self.bt_status.setText("Loading paired devices...")
-        self.bt_status.setStyleSheet("color: #ffaa00; font-weight: bold;")
+        self._set_status("Loading paired devices...", _STYLE_BUSY)
         self.signals.log_signal.emit("Fetching paired devices...", "info")
         
         # Start in thread
-        thread = threading.Thread(target=self._fetch_paired_devices, daemon=True)
-        thread.start()
-        print("Paired devices thread started")
+        self._pool.start(self._fetch_paired_devices)
+        log.debug("Paired devices job queued")
     
     def _fetch_paired_devices(self):
-        """Fetch paired devices from bluetoothctl."""
-        print("_fetch_paired_devices started")
-        try:
-            result = subprocess.run(
-                ["bluetoothctl", "paired-devices"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+        """Fetch paired devices from BlueZ (D-Bus if available, else bluetoothctl)."""
+        log.debug("_fetch_paired_devices started")
+        if DBUS_AVAILABLE:
+            try:
+                devices = asyncio.run(self._fetch_paired_devices_dbus())
+            except Exception as e:
+                log.error("Error in _fetch_paired_devices_dbus: %s", e)
+                self.scan_error_signal.emit(str(e))
+                return
             
-            print(f"bluetoothctl return code: {result.returncode}")
-            print(f"bluetoothctl stdout: {result.stdout}")
-            print(f"bluetoothctl stderr: {result.stderr}")
+            log.debug("Total devices found: %d", len(devices))
+            self._cache_paired(devices)
+            self.discovered_devices = devices
+            self.devices_found.emit(devices)
+            return
+        
+        try:
+            output = self._btctl_cmd("paired-devices")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("bluetoothctl output: %s", output)
             
-            devices = []
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    line = line.strip()
-                    print(f"Processing line: {line}")
-                    
-                    if line.startswith("Device "):
-                        parts = line.split(" ", 2)
-                        if len(parts) >= 2:
-                            mac = parts[1]
-                            name = parts[2] if len(parts) > 2 else "Unknown"
-                            devices.append({
-                                "name": name,
-                                "mac": mac,
-                                "channels": [1],
-                                "paired": True
-                            })
-                            print(f"Added device: {name} ({mac})")
-            else:
-                error_msg = f"bluetoothctl error: {result.stderr}"
-                print(error_msg)
-                self.signals.log_signal.emit(error_msg, "error")
+            by_mac = {}
+            for line in _ANSI_RE.sub("", output).splitlines():
+                line = line.strip()
+                # Skip discovery/property events the session prints between commands
+                if line.startswith(_EVENT_PREFIXES):
+                    continue
+                match = _PAIRED_LINE_RE.match(line)
+                if not match:
+                    continue
+                log.debug("Processing line: %s", line)
+                
+                mac, name = match.groups()
+                if mac in by_mac:
+                    continue
+                by_mac[mac] = {
+                    "name": name.strip() or "Unknown",
+                    "mac": mac,
+                    "channels": [1],
+                    "paired": True
+                }
+                log.debug("Added device: %s (%s)", name, mac)
+            devices = list(by_mac.values())
             
-            print(f"Total devices found: {len(devices)}")
+            log.debug("Total devices found: %d", len(devices))
+            self._cache_paired(devices)
             self.discovered_devices = devices
             
             # Emit signal to update UI
@@ -243,98 +434,402 @@ class BluetoothPanel(QGroupBox):
         
         except FileNotFoundError:
             error_msg = "bluetoothctl not found. Install bluez-utils."
-            print(error_msg)
+            log.error(error_msg)
             self.scan_error_signal.emit(error_msg)
         
         except Exception as e:
-            print(f"Error in _fetch_paired_devices: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in _fetch_paired_devices: %s", e)
             self.scan_error_signal.emit(str(e))
     
+    def _btctl_cmd(self, cmd, timeout=BTCTL_TIMEOUT):
+        """Run ``cmd`` in a persistent bluetoothctl session.
+        
+        bluetoothctl has no end-of-reply marker when stdin is not a TTY, so
+        every command is followed by ``version`` and output is read until
+        its reply appears.
+        
+        Args:
+            cmd: bluetoothctl command line, without trailing newline
+            timeout: Seconds to wait for the reply
+            
+        Returns:
+            Everything bluetoothctl printed in response, as text.
+        """
+        with self._btctl_lock:
+            if self._btctl is None or self._btctl.poll() is not None:
+                self._btctl = subprocess.Popen(
+                    ["bluetoothctl"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+            
+            try:
+                fd = self._btctl.stdout.fileno()
+                # Drop events printed since the last command so they are not
+                # mistaken for part of this reply
+                while select.select([fd], [], [], 0)[0]:
+                    if not os.read(fd, 4096):
+                        raise RuntimeError("bluetoothctl exited unexpectedly")
+                
+                self._btctl.stdin.write(f"{cmd}\nversion\n".encode())
+                self._btctl.stdin.flush()
+                
+                buf = b""
+                deadline = time.monotonic() + timeout
+                while b"Version " not in buf:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                        raise subprocess.TimeoutExpired(cmd, timeout)
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        raise RuntimeError("bluetoothctl exited unexpectedly")
+                    buf += chunk
+            except Exception:
+                # Session state is unknown now, start fresh next time
+                self._close_btctl()
+                raise
+            
+            return buf.decode(errors="replace")
+    
+    def _close_btctl(self):
+        """Terminate the bluetoothctl session, if one is running."""
+        if self._btctl is None:
+            return
+        if self._btctl.poll() is None:
+            self._btctl.terminate()
+            try:
+                self._btctl.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._btctl.kill()
+        self._btctl = None
+    
+    def shutdown(self):
+        """Release background resources. Call when the window closes."""
+        self._pool.clear()
+        with self._btctl_lock:
+            self._close_btctl()
+        
+        # Stop the paired-device watcher; it disconnects its bus on the way out
+        self._shutting_down = True
+        loop, stop = self._watch_loop, self._watch_stop
+        if loop is not None and stop is not None:
+            try:
+                loop.call_soon_threadsafe(lambda: stop.done() or stop.set_result(None))
+            except RuntimeError:
+                pass  # Loop already closed
+        if self._watch_thread is not None:
+            self._watch_thread.join(timeout=1)
+            self._watch_thread = None
+    
+    def _cache_paired(self, devices):
+        """Remember a paired-device listing for PAIRED_CACHE_TTL seconds."""
+        self._paired_cache = devices
+        self._paired_cache_ts = time.monotonic()
+    
+    def _watch_paired_thread(self):
+        """Background thread invalidating the paired cache on BlueZ changes."""
+        try:
+            asyncio.run(self._watch_paired_dbus())
+        except Exception as e:
+            log.warning("Paired-device watcher stopped: %s", e)
+    
+    async def _watch_paired_dbus(self):
+        """Expire the paired cache whenever a device's Paired flag changes.
+        
+        Runs until shutdown() resolves ``_watch_stop`` or the bus drops.
+        """
+        loop = asyncio.get_running_loop()
+        self._watch_stop = loop.create_future()
+        self._watch_loop = loop
+        if self._shutting_down:
+            return
+        
+        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        
+        def on_message(msg):
+            if msg.message_type != MessageType.SIGNAL:
+                return
+            if msg.member == "InterfacesRemoved":
+                self._paired_cache_ts = 0.0
+            elif msg.member == "PropertiesChanged":
+                iface, changed, _ = msg.body
+                if iface == BLUEZ_DEVICE_IFACE and "Paired" in changed:
+                    self._paired_cache_ts = 0.0
+        
+        try:
+            bus.add_message_handler(on_message)
+            await _add_match(bus, f"type='signal',sender='{BLUEZ_SERVICE}',"
+                                  f"interface='{OBJECT_MANAGER_IFACE}',member='InterfacesRemoved'")
+            await _add_match(bus, f"type='signal',sender='{BLUEZ_SERVICE}',"
+                                  f"interface='{PROPERTIES_IFACE}',member='PropertiesChanged',"
+                                  f"arg0='{BLUEZ_DEVICE_IFACE}'")
+            
+            # Stay subscribed until shutdown or the bus goes away
+            disconnected = asyncio.ensure_future(bus.wait_for_disconnect())
+            await asyncio.wait({self._watch_stop, disconnected},
+                               return_when=asyncio.FIRST_COMPLETED)
+            disconnected.cancel()
+        finally:
+            bus.disconnect()
+            self._watch_loop = None
+    
+    async def _discover_devices_dbus(self, duration=DISCOVERY_DURATION, purge=True):
+        """Run a BR/EDR discovery session, streaming devices as BlueZ reports them.
+        
+        New devices arrive through ObjectManager.InterfacesAdded. Devices BlueZ
+        already knows about only get an RSSI update via PropertiesChanged, so
+        both signals are watched. Devices already in ``discovered_devices``
+        are not reported again.
+        
+        Args:
+            duration: Seconds to keep discovery running
+            purge: Remove stale cached devices before starting
+        """
+        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        try:
+            adapter = await _get_adapter(bus)
+            known = {
+                path: interfaces[BLUEZ_DEVICE_IFACE]
+                for path, interfaces in (await _get_managed_objects(bus)).items()
+                if BLUEZ_DEVICE_IFACE in interfaces
+            }
+            if purge:
+                await self._purge_stale_devices(adapter, known)
+            seen = {d["mac"] for d in self.discovered_devices}
+            
+            def report(props):
+                if "Address" not in props or not _MAC_RE.match(props["Address"].value):
+                    return
+                dev = _device_from_props(props)
+                if dev["mac"] in seen:
+                    return
+                seen.add(dev["mac"])
+                self.discovered_devices.append(dev)
+                self.device_discovered.emit(dev)
+            
+            def on_message(msg):
+                if msg.message_type != MessageType.SIGNAL:
+                    return
+                if msg.member == "InterfacesAdded":
+                    path, interfaces = msg.body
+                    props = interfaces.get(BLUEZ_DEVICE_IFACE)
+                    if props:
+                        known[path] = props
+                        report(props)
+                elif msg.member == "PropertiesChanged":
+                    iface, changed, _ = msg.body
+                    if iface == BLUEZ_DEVICE_IFACE and "RSSI" in changed and msg.path in known:
+                        report(known[msg.path])
+            
+            bus.add_message_handler(on_message)
+            await _add_match(bus, f"type='signal',sender='{BLUEZ_SERVICE}',"
+                                  f"interface='{OBJECT_MANAGER_IFACE}',member='InterfacesAdded'")
+            await _add_match(bus, f"type='signal',sender='{BLUEZ_SERVICE}',"
+                                  f"interface='{PROPERTIES_IFACE}',member='PropertiesChanged'")
+            
+            await adapter.call_set_discovery_filter({
+                "Transport": Variant("s", "bredr"),
+                "DuplicateData": Variant("b", False),
+            })
+            try:
+                await adapter.call_start_discovery()
+                try:
+                    await asyncio.sleep(duration)
+                finally:
+                    await adapter.call_stop_discovery()
+            finally:
+                await adapter.call_set_discovery_filter({})
+        finally:
+            bus.disconnect()
+    
+    async def _purge_stale_devices(self, adapter, known):
+        """Drop cached devices BlueZ has not actually seen, so they don't show up as ghosts.
+        
+        Connected, paired and trusted devices are kept, as is anything with a
+        current RSSI. Removed paths are deleted from ``known`` as well.
+        """
+        for path, props in list(known.items()):
+            if any(props.get(key) and props[key].value
+                   for key in ("Connected", "Paired", "Trusted")):
+                continue
+            if "RSSI" in props:
+                continue
+            try:
+                await adapter.call_remove_device(path)
+                del known[path]
+            except Exception as e:
+                log.debug("Could not remove stale device %s: %s", path, e)
+    
+    async def _fetch_paired_devices_dbus(self):
+        """Query org.bluez over the system bus for paired devices."""
+        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        try:
+            objects = await _get_managed_objects(bus)
+        finally:
+            bus.disconnect()
+        
+        devices = []
+        for path, interfaces in objects.items():
+            props = interfaces.get(BLUEZ_DEVICE_IFACE)
+            if not props or not props.get("Paired") or not props["Paired"].value:
+                continue
+            if "Address" not in props or not _MAC_RE.match(props["Address"].value):
+                continue
+            
+            name = props.get("Name") or props.get("Alias")
+            devices.append({
+                "name": name.value if name else "Unknown",
+                "mac": props["Address"].value,
+                "channels": [1],
+                "paired": True
+            })
+        return devices
+    
     @Slot(list)
     def _update_scan_result(self, devices):
         """Update UI with scan results. Runs on main thread."""
-        print(f"_update_scan_result called with {len(devices)} devices (on main thread)")
+        log.debug("_update_scan_result called with %d devices (on main thread)", len(devices))
         
-        self.bt_list.clear()
+        self._fill_list(devices)
         
         if not devices:
-            self.bt_status.setText("No devices found")
-            self.bt_status.setStyleSheet("color: #ff4444; font-weight: bold;")
+            self._set_status("No devices found", _STYLE_ERROR)
             self.signals.log_signal.emit("No devices found. Try pairing via system settings first.", "warning")
             return
         
-        for dev in devices:
-            ch = ",".join(map(str, dev["channels"]))
-            paired = " [PAIRED]" if dev.get("paired") else ""
-            item_text = f"{dev['name']} ({dev['mac']}) [Ch: {ch}]{paired}"
-            print(f"Adding item to list: {item_text}")
-            self.bt_list.addItem(item_text)
-        
-        self.bt_status.setText(f"Found {len(devices)} device(s)")
-        self.bt_status.setStyleSheet("color: #00ff88; font-weight: bold;")
+        self._set_status(f"Found {len(devices)} device(s)", _STYLE_OK)
         self.signals.log_signal.emit(f"Found {len(devices)} device(s)", "success")
         
-        print(f"Device list updated - list now has {self.bt_list.count()} items")
+        log.debug("Device list updated - list now has %d items", self.bt_list.count())
+    
+    def _fill_list(self, devices):
+        """Replace the list contents with ``devices`` in a single batch."""
+        self._dev_by_mac = {d["mac"]: d for d in devices}
+        self.bt_list.setUpdatesEnabled(False)
+        self.bt_list.clear()
+        self.bt_list.addItems([self._device_text(d) for d in devices])
+        for row, dev in enumerate(devices):
+            self.bt_list.item(row).setData(Qt.UserRole, dev["mac"])
+        self.bt_list.setUpdatesEnabled(True)
+    
+    @Slot(dict)
+    def _add_scan_result(self, dev):
+        """Append a single device while discovery is still running."""
+        self._dev_by_mac[dev["mac"]] = dev
+        self.bt_list.addItem(self._device_item(dev))
+        self._set_status(f"Scanning... {self.bt_list.count()} found", _STYLE_BUSY)
+    
+    @staticmethod
+    def _device_text(dev):
+        """Format a device entry for the list widget."""
+        ch = ",".join(map(str, dev["channels"])) or "?"
+        paired = " [PAIRED]" if dev.get("paired") else ""
+        return f"{dev['name']} ({dev['mac']}) [Ch: {ch}]{paired}"
+    
+    @classmethod
+    def _device_item(cls, dev):
+        """Create a list item carrying the device MAC in Qt.UserRole."""
+        item = QListWidgetItem(cls._device_text(dev))
+        item.setData(Qt.UserRole, dev["mac"])
+        return item
     
     @Slot(str)
     def _scan_error(self, msg):
         """Handle scan error. Runs on main thread."""
-        print(f"_scan_error called: {msg} (on main thread)")
-        self.bt_status.setText("Scan failed")
-        self.bt_status.setStyleSheet("color: #ff4444; font-weight: bold;")
+        log.debug("_scan_error called: %s (on main thread)", msg)
+        self._set_status("Scan failed", _STYLE_ERROR)
         self.signals.log_signal.emit(f"Scan error: {msg}", "error")
         self.signals.log_signal.emit("Check: sudo systemctl start bluetooth", "warning")
     
+    @Slot(QListWidgetItem)
     def select_bt_device(self, item):
             """Handle device selection."""
             text = item.text()
-            print(f"Device selected: {text}")
+            log.debug("Device selected: %s", text)
             
-            mac_match = re.search(r'\(([0-9A-Fa-f:]+)\)', text)
-            if not mac_match:
-                self.signals.log_signal.emit("Could not parse MAC address", "error")
+            mac = item.data(Qt.UserRole)
+            dev = self._dev_by_mac.get(mac)
+            if dev is None:
+                self.signals.log_signal.emit("Unknown device selected", "error")
                 return
             
-            self.selected_mac = mac_match.group(1)
-            print(f"Selected MAC: {self.selected_mac}")
+            self.selected_mac = mac
+            log.debug("Selected MAC: %s", self.selected_mac)
             
-            self.connect_btn.setEnabled(True)
-            self.bt_status.setText(f"Selected: {self.selected_mac}")
-            self.bt_status.setStyleSheet("color: #00ff88; font-weight: bold;")
+            self.connect_btn.setEnabled(not self._connecting)
+            self._set_status(f"Selected: {self.selected_mac}", _STYLE_OK)
             self.signals.log_signal.emit(f"Selected: {text}", "info")
+            
+            if not dev["channels"]:
+                if BLUETOOTH_AVAILABLE:
+                    self._pool.start(partial(self._lookup_channels_thread, dev))
+                else:
+                    dev["channels"] = [1]
+                    item.setText(self._device_text(dev))
+    
+    def _lookup_channels_thread(self, dev):
+        """Resolve RFCOMM channels for a device via SDP."""
+        try:
+            services = bluetooth.find_service(address=dev["mac"])
+            channels = _spp_channels(services)
+        except Exception as e:
+            log.warning("Error getting services for %s: %s", dev["mac"], e)
+            channels = []
+        dev["channels"] = channels or [DEFAULT_RFCOMM_CHANNEL]
+        self.channels_resolved.emit(dev["mac"])
+    
+    @Slot(str)
+    def _update_channels(self, mac):
+        """Refresh the list entry of a device whose channels were resolved."""
+        dev = self._dev_by_mac.get(mac)
+        if dev is None:
+            return
+        for row in range(self.bt_list.count()):
+            item = self.bt_list.item(row)
+            if item.data(Qt.UserRole) == mac:
+                item.setText(self._device_text(dev))
+                break
     
+    @Slot()
     def connect_via_socket(self):
             """Connect via direct socket."""
             if not self.selected_mac:
                 self.signals.log_signal.emit("No device selected!", "error")
                 return
             
-            self.bt_status.setText("Connecting via socket...")
-            self.bt_status.setStyleSheet("color: #ffaa00; font-weight: bold;")
+            if self._connecting:
+                return
             
-            # Use default channel 1
-            threading.Thread(
-                target=self._connect_socket_thread,
-                args=(1,),  # Default channel
-                daemon=True
-            ).start()
+            # One attempt at a time; its connect_direct result alone sets the status
+            self._connecting = True
+            self.connect_btn.setEnabled(False)
+            self._set_status("Connecting via socket...", _STYLE_BUSY)
+            
+            # First Serial Port channel, default DEFAULT_RFCOMM_CHANNEL
+            dev = self._dev_by_mac.get(self.selected_mac)
+            channel = dev["channels"][0] if dev and dev["channels"] else DEFAULT_RFCOMM_CHANNEL
+            self._pool.start(partial(self._connect_socket_thread, self.selected_mac, channel))
     
-    def _connect_socket_thread(self, channel):
+    def _connect_socket_thread(self, mac, channel):
         """Background thread for socket connection."""
-        success = self.backend.bluetooth.connect_direct(self.selected_mac, channel)
+        success = self.backend.bluetooth.connect_direct(mac, channel)
         if success:
-            # Update on main thread
-            self.devices_found.emit([])  # Dummy signal
-            self.bt_status.setText(f"Connected to {self.selected_mac}")
-            self.bt_status.setStyleSheet("color: #00ff88; font-weight: bold;")
+            self.connected_signal.emit(mac)
         else:
             self.connection_failed_signal.emit("socket failed")
     
+    @Slot(str)
+    def _connected(self, mac):
+        """Handle an established connection. Runs on main thread."""
+        self._connecting = False
+        self.connect_btn.setEnabled(True)
+        self._set_status(f"Connected to {mac}", _STYLE_OK)
+    
     @Slot(str)
     def _connection_failed(self, msg):
         """Handle connection failure. Runs on main thread."""
-        self.bt_status.setText("Connection failed")
-        self.bt_status.setStyleSheet("color: #ff4444; font-weight: bold;")
+        self._connecting = False
+        self.connect_btn.setEnabled(self.selected_mac is not None)
+        self._set_status("Connection failed", _STYLE_ERROR)
         self.signals.log_signal.emit(f"Connection failed: {msg}", "error")
\ No newline at end of file
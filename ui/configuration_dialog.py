@@ -167,14 +167,9 @@ class ConfigurationDialog(QDialog):
             # Refresh parent dialog if it exists
             if self.parent():
                 parent = self.parent()
-                if hasattr(parent, '_refresh_custom_gestures'):
-                    parent._refresh_custom_gestures()
-                if hasattr(parent, '_refresh_custom_voices'):
-                    parent._refresh_custom_voices()
-                if hasattr(parent, '_load_voice_mapping'):
-                    parent._load_voice_mapping()
-                if hasattr(parent, '_load_gesture_mapping'):
-                    parent._load_gesture_mapping()
+                if hasattr(parent, '_load_mapping'):
+                    parent._load_mapping("voice")
+                    parent._load_mapping("gesture")
         else:
             QMessageBox.critical(self, "Error", "Failed to load configuration.")
     
@@ -2,20 +2,68 @@
 Manual control panel UI component.
 """
 
-from PySide6.QtWidgets import QGroupBox, QGridLayout, QPushButton, QLabel, QVBoxLayout
-from PySide6.QtGui import QFont
+from functools import lru_cache, partial
+
+from PySide6.QtWidgets import (QApplication, QGroupBox, QGridLayout, QPushButton, QLabel,
+                               QStyle, QVBoxLayout)
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon
 
 from config import STOP_DRIVE, STOP_ARM1, STOP_ARM2, STOP_ARM3, STOP_ALL, TOGGLE_LED
 
 
+# Freedesktop theme icon -> built-in style icon used when the theme lacks it
+_ICON_FALLBACKS = {
+    "go-up": QStyle.SP_ArrowUp,
+    "go-down": QStyle.SP_ArrowDown,
+    "go-previous": QStyle.SP_ArrowLeft,
+    "go-next": QStyle.SP_ArrowRight,
+    "process-stop": QStyle.SP_BrowserStop,
+    "object-rotate-right": QStyle.SP_BrowserReload,
+    "object-rotate-left": QStyle.SP_BrowserReload,
+    "dialog-information": QStyle.SP_MessageBoxInformation,
+}
+
+
+@lru_cache(maxsize=None)
+def _icon(name):
+    """Return the themed icon ``name``, loaded once per process."""
+    icon = QIcon.fromTheme(name)
+    if icon.isNull():
+        icon = QApplication.style().standardIcon(_ICON_FALLBACKS[name])
+    return icon
+
+
 class ControlPanel(QGroupBox):
     """Manual control buttons for robot."""
     
+    # (icon, label, press command, release command, row, col)
+    # Motion buttons are dead-man switches: the motor runs while the button is
+    # held (pressed) and stops on release. STOP and LED are one-shot actions
+    # and fire on clicked.
+    _DRIVE_SPEC = (
+        ("go-up", "Forward", 'F', STOP_DRIVE, 0, 1),
+        ("go-previous", "Left", 'L', STOP_DRIVE, 1, 0),
+        ("go-next", "Right", 'R', STOP_DRIVE, 1, 2),
+        ("go-down", "Backward", 'B', STOP_DRIVE, 2, 1),
+    )
+    _ARM_LABELS = ("Arm 1", "Arm 2", "Arm 3")
+    _ARM_SPEC = (
+        ("go-up", "Up", 'Z', STOP_ARM1, 1, 0),
+        ("go-down", "Down", 'A', STOP_ARM1, 2, 0),
+        ("go-up", "Up", 'S', STOP_ARM2, 1, 1),
+        ("go-down", "Down", 'X', STOP_ARM2, 2, 1),
+        ("object-rotate-right", "CW", 'C', STOP_ARM3, 1, 2),
+        ("object-rotate-left", "CCW", 'V', STOP_ARM3, 2, 2),
+    )
+    # (icon, label, command) - fired once on click
+    _LED_SPEC = ("dialog-information", "Toggle LED", TOGGLE_LED)
+    
     def __init__(self, backend, parent=None):
         super().__init__("🕹️ Manual Controls", parent)
         self.backend = backend
         self.all_buttons = []  # Store all button references
+        self.themeable_buttons = []  # Buttons restyled on theme change (all but STOP)
         self._init_ui()
     
     def _init_ui(self):
@@ -26,35 +74,12 @@ class ControlPanel(QGroupBox):
         drive_group = QGroupBox("🚗 Drive Controls")
         drive_layout = QGridLayout()
         
-        btn_forward = QPushButton("⬆️ Forward")
-        btn_forward.pressed.connect(lambda: self.backend.send_command('F'))
-        btn_forward.released.connect(lambda: self.backend.send_command(STOP_DRIVE))
-        drive_layout.addWidget(btn_forward, 0, 1)
-        self.all_buttons.append(btn_forward)
-        
-        btn_left = QPushButton("⬅️ Left")
-        btn_left.pressed.connect(lambda: self.backend.send_command('L'))
-        btn_left.released.connect(lambda: self.backend.send_command(STOP_DRIVE))
-        drive_layout.addWidget(btn_left, 1, 0)
-        self.all_buttons.append(btn_left)
+        for spec in self._DRIVE_SPEC:
+            self._make_button(*spec, grid=drive_layout)
         
-        btn_stop = QPushButton("⏹️ STOP")
+        btn_stop = self._make_button("process-stop", "STOP", STOP_ALL, None, 1, 1,
+                                     grid=drive_layout, themeable=False)
         btn_stop.setStyleSheet("background: #ff4444; font-weight: bold; color: white;")
-        btn_stop.clicked.connect(lambda: self.backend.send_command(STOP_ALL))
-        drive_layout.addWidget(btn_stop, 1, 1)
-        self.all_buttons.append(btn_stop)
-        
-        btn_right = QPushButton("➡️ Right")
-        btn_right.pressed.connect(lambda: self.backend.send_command('R'))
-        btn_right.released.connect(lambda: self.backend.send_command(STOP_DRIVE))
-        drive_layout.addWidget(btn_right, 1, 2)
-        self.all_buttons.append(btn_right)
-        
-        btn_backward = QPushButton("⬇️ Backward")
-        btn_backward.pressed.connect(lambda: self.backend.send_command('B'))
-        btn_backward.released.connect(lambda: self.backend.send_command(STOP_DRIVE))
-        drive_layout.addWidget(btn_backward, 2, 1)
-        self.all_buttons.append(btn_backward)
         
         drive_group.setLayout(drive_layout)
         layout.addWidget(drive_group)
@@ -65,72 +90,56 @@ class ControlPanel(QGroupBox):
         arm_group.setChecked(True)  # Start expanded (checked = expanded)
         arm_layout = QGridLayout()
         
-        # Arm 1 - Column 0
-        arm1_label = QLabel("Arm 1")
-        arm1_label.setStyleSheet("font-weight: bold; font-size: 12px;")
-        arm_layout.addWidget(arm1_label, 0, 0)
+        for col, label in enumerate(self._ARM_LABELS):
+            arm_label = QLabel(label)
+            arm_label.setStyleSheet("font-weight: bold; font-size: 12px;")
+            arm_layout.addWidget(arm_label, 0, col)
         
-        btn_arm1_up = QPushButton("⬆️ Up")
-        btn_arm1_up.pressed.connect(lambda: self.backend.send_command('Z'))
-        btn_arm1_up.released.connect(lambda: self.backend.send_command(STOP_ARM1))
-        arm_layout.addWidget(btn_arm1_up, 1, 0)
-        self.all_buttons.append(btn_arm1_up)
-        
-        btn_arm1_down = QPushButton("⬇️ Down")
-        btn_arm1_down.pressed.connect(lambda: self.backend.send_command('A'))
-        btn_arm1_down.released.connect(lambda: self.backend.send_command(STOP_ARM1))
-        arm_layout.addWidget(btn_arm1_down, 2, 0)
-        self.all_buttons.append(btn_arm1_down)
-        
-        # Arm 2 - Column 1
-        arm2_label = QLabel("Arm 2")
-        arm2_label.setStyleSheet("font-weight: bold; font-size: 12px;")
-        arm_layout.addWidget(arm2_label, 0, 1)
-        
-        btn_arm2_up = QPushButton("⬆️ Up")
-        btn_arm2_up.pressed.connect(lambda: self.backend.send_command('S'))
-        btn_arm2_up.released.connect(lambda: self.backend.send_command(STOP_ARM2))
-        arm_layout.addWidget(btn_arm2_up, 1, 1)
-        self.all_buttons.append(btn_arm2_up)
-        
-        btn_arm2_down = QPushButton("⬇️ Down")
-        btn_arm2_down.pressed.connect(lambda: self.backend.send_command('X'))
-        btn_arm2_down.released.connect(lambda: self.backend.send_command(STOP_ARM2))
-        arm_layout.addWidget(btn_arm2_down, 2, 1)
-        self.all_buttons.append(btn_arm2_down)
-        
-        # Arm 3 - Column 2
-        arm3_label = QLabel("Arm 3")
-        arm3_label.setStyleSheet("font-weight: bold; font-size: 12px;")
-        arm_layout.addWidget(arm3_label, 0, 2)
-        
-        btn_arm3_cw = QPushButton("↻ CW")
-        btn_arm3_cw.pressed.connect(lambda: self.backend.send_command('C'))
-        btn_arm3_cw.released.connect(lambda: self.backend.send_command(STOP_ARM3))
-        arm_layout.addWidget(btn_arm3_cw, 1, 2)
-        self.all_buttons.append(btn_arm3_cw)
-        
-        btn_arm3_ccw = QPushButton("↺ CCW")
-        btn_arm3_ccw.pressed.connect(lambda: self.backend.send_command('V'))
-        btn_arm3_ccw.released.connect(lambda: self.backend.send_command(STOP_ARM3))
-        arm_layout.addWidget(btn_arm3_ccw, 2, 2)
-        self.all_buttons.append(btn_arm3_ccw)
+        for spec in self._ARM_SPEC:
+            self._make_button(*spec, grid=arm_layout)
         
         arm_group.setLayout(arm_layout)
         layout.addWidget(arm_group)
         
         # LED toggle
-        btn_led = QPushButton("💡 Toggle LED")
-        btn_led.clicked.connect(lambda: self.backend.send_command(TOGGLE_LED))
-        layout.addWidget(btn_led)
-        self.all_buttons.append(btn_led)
+        icon, label, cmd = self._LED_SPEC
+        layout.addWidget(self._make_button(icon, label, cmd, None))
         
         self.setLayout(layout)
     
+    def _make_button(self, icon, label, press, release, row=0, col=0, grid=None, themeable=True):
+        """Create a command button and register it in all_buttons.
+        
+        Args:
+            icon: Theme icon name (see _ICON_FALLBACKS)
+            label: Button text
+            press: Command sent on press (or on click if release is None)
+            release: Command sent on release, or None for a click button
+            row: Grid row
+            col: Grid column
+            grid: QGridLayout to place the button in, if any
+            themeable: Whether refresh_theme() should reset the button style
+            
+        Returns:
+            The created QPushButton
+        """
+        send = self.backend.send_command
+        btn = QPushButton(_icon(icon), label)
+        # Buttons and backend both live on the GUI thread: connect directly
+        if release is None:
+            btn.clicked.connect(partial(send, press), Qt.DirectConnection)
+        else:
+            btn.pressed.connect(partial(send, press), Qt.DirectConnection)
+            btn.released.connect(partial(send, release), Qt.DirectConnection)
+        if grid is not None:
+            grid.addWidget(btn, row, col)
+        self.all_buttons.append(btn)
+        if themeable:
+            self.themeable_buttons.append(btn)
+        return btn
+    
     def refresh_theme(self):
         """Refresh button styles after theme change."""
-        # Force style update for all buttons except STOP
-        for button in self.all_buttons:
-            if "STOP" not in button.text():
-                # Clear inline styles to use palette
-                button.setStyleSheet("")
\ No newline at end of file
+        # Clear inline styles to use palette (STOP keeps its red style)
+        for button in self.themeable_buttons:
+            button.setStyleSheet("")
\ No newline at end of file
@@ -3,17 +3,94 @@ Dialog for capturing and creating custom gestures.
 """
 
 import time
+import zlib
+import queue
+from functools import lru_cache
+
 import cv2
 import numpy as np
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
+from PySide6.QtWidgets import (QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QLineEdit, QMessageBox, QProgressBar,
                                QSpinBox)
-from PySide6.QtCore import QTimer, Qt
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import Qt, Signal, QThread, QRegularExpression
+from PySide6.QtGui import QImage, QPixmap, QRegularExpressionValidator
 
 from core.embedding_extractor import EmbeddingExtractor
 from config import GESTURE_TRAINING_FRAMES
 
+PREVIEW_WIDTH = 480
+PREVIEW_HEIGHT = 360
+
+
+@lru_cache(maxsize=2)
+def _get_extractor(model_path):
+    """Load an EmbeddingExtractor once per model and share it between dialogs."""
+    return EmbeddingExtractor(model_path)
+
+
+class ExtractorThread(QThread):
+    """Thread computing embeddings so inference doesn't stall the preview."""
+    result = Signal(object)  # Emits embedding vector
+    
+    def __init__(self, extractor):
+        super().__init__()
+        self.extractor = extractor
+        self.frames = queue.Queue(maxsize=1)
+        self._running = True
+    
+    def submit(self, frame):
+        """Queue an RGB frame; dropped if the previous one is still pending."""
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            pass
+    
+    def run(self):
+        """Extract embeddings from queued frames until stopped."""
+        while self._running:
+            try:
+                frame = self.frames.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            try:
+                embedding = self.extractor.extract_from_frame(frame)
+            except Exception as e:
+                print(f"Error capturing frame: {e}")
+                continue
+            
+            if embedding is not None:
+                self.result.emit(embedding)
+    
+    def stop(self):
+        """Stop the thread and wait for the current extraction to finish."""
+        self._running = False
+        self.wait()
+
+
+class GrabberThread(QThread):
+    """Thread reading camera frames as the driver delivers them."""
+    frame = Signal(object)  # Emits BGR frame
+    
+    def __init__(self, camera):
+        super().__init__()
+        self.camera = camera
+        self._running = True
+    
+    def run(self):
+        """Block on the camera and forward each frame until stopped."""
+        while self._running:
+            ret, frame = self.camera.read()
+            if not ret or frame is None:
+                self.msleep(10)  # Don't spin on a failing camera
+                continue
+            self.frame.emit(frame)
+    
+    def stop(self):
+        """Stop the thread and wait for the pending read to return."""
+        self._running = False
+        self.wait()
+
 
 class CustomGestureDialog(QDialog):
     """Dialog for capturing custom gestures."""
@@ -22,8 +99,17 @@ class CustomGestureDialog(QDialog):
         super().__init__(parent)
         self.camera = camera
         self.model_path = model_path
-        self.existing_letters = existing_letters
-        self.embeddings = []
+        self.existing_letters = frozenset(existing_letters)
+        self._emb_buf = None  # (frames_to_capture, extractor.dim) float32
+        self._last_fp = None  # Fingerprint of the last frame sent for extraction
+        
+        # Preview frames are resized into this buffer, which the QImage wraps.
+        # Both live as long as the dialog, so the QImage never dangles.
+        self._preview_buf = np.zeros((PREVIEW_HEIGHT, PREVIEW_WIDTH, 3), dtype=np.uint8)
+        self._qimg = QImage(self._preview_buf.data, PREVIEW_WIDTH, PREVIEW_HEIGHT,
+                            self._preview_buf.strides[0], QImage.Format_BGR888)
+        self._preview_view = self._preview_buf  # Letterboxed region frames are resized into
+        self._preview_src_shape = None  # Frame shape _preview_view was fitted for
         self.capturing = False
         self.frames_to_capture = GESTURE_TRAINING_FRAMES
         self.frames_captured = 0
@@ -31,12 +117,22 @@ class CustomGestureDialog(QDialog):
         self.setWindowTitle("Create Custom Gesture")
         self.setMinimumSize(600, 600)
         
-        # Initialize extractor
+        # Initialize extractor (cached after the first load)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
         try:
-            self.extractor = EmbeddingExtractor(model_path)
+            self.extractor = _get_extractor(model_path)
         except Exception as e:
+            QApplication.restoreOverrideCursor()
             QMessageBox.critical(self, "Error", f"Failed to load model: {e}")
             self.extractor = None
+        else:
+            QApplication.restoreOverrideCursor()
+        
+        self.extractor_thread = None
+        if self.extractor:
+            self.extractor_thread = ExtractorThread(self.extractor)
+            self.extractor_thread.result.connect(self._on_embedding)
+            self.extractor_thread.start()
         
         self._init_ui()
         self._start_preview()
@@ -69,6 +165,7 @@ class CustomGestureDialog(QDialog):
         self.letter_input = QLineEdit()
         self.letter_input.setMaxLength(1)
         self.letter_input.setPlaceholderText("Single letter")
+        self.letter_input.setValidator(QRegularExpressionValidator(QRegularExpression(r"\S")))
         letter_layout.addWidget(self.letter_input)
         layout.addLayout(letter_layout)
         
@@ -87,11 +184,19 @@ class CustomGestureDialog(QDialog):
         
         # Video preview
         self.video_label = QLabel("Camera Preview")
-        self.video_label.setFixedSize(480, 360)
+        self.video_label.setFixedSize(PREVIEW_WIDTH, PREVIEW_HEIGHT)
         self.video_label.setStyleSheet("border: 2px solid #00ff88; background: #000;")
         self.video_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.video_label, alignment=Qt.AlignCenter)
         
+        # Capture overlay, composited by Qt on top of the preview
+        self.overlay_label = QLabel(self.video_label)
+        self.overlay_label.setStyleSheet(
+            "color: #00ff00; font-weight: bold; font-size: 16px; background: transparent; border: none;"
+        )
+        self.overlay_label.move(10, 10)
+        self.overlay_label.hide()
+        
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setMaximum(self.frames_to_capture)
@@ -107,6 +212,7 @@ class CustomGestureDialog(QDialog):
         btn_layout = QHBoxLayout()
         
         self.capture_btn = QPushButton("Start Capture")
+        self.capture_btn.setEnabled(False)
         self.capture_btn.clicked.connect(self._start_capture)
         btn_layout.addWidget(self.capture_btn)
         
@@ -122,9 +228,8 @@ class CustomGestureDialog(QDialog):
         layout.addLayout(btn_layout)
         self.setLayout(layout)
         
-        # Timer for video preview
-        self.preview_timer = QTimer()
-        self.preview_timer.timeout.connect(self._update_preview)
+        self.name_input.textChanged.connect(self._update_start_enabled)
+        self.letter_input.textChanged.connect(self._update_start_enabled)
     
     def _on_frame_count_changed(self, value):
         """Handle frame count change."""
@@ -133,93 +238,133 @@ class CustomGestureDialog(QDialog):
     
     def _start_preview(self):
         """Start video preview."""
+        self.grabber_thread = None
         if self.camera:
-            self.preview_timer.start(30)  # 30ms = ~33 FPS
+            self.grabber_thread = GrabberThread(self.camera)
+            self.grabber_thread.frame.connect(self._update_preview)
+            self.grabber_thread.start()
     
-    def _update_preview(self):
-        """Update video preview."""
-        if not self.camera:
-            return
+    def _update_preview(self, frame):
+        """Show a frame from the grabber thread and feed capture."""
+        # Cheap fingerprint of a sparse green-channel sample, to spot the
+        # driver handing back the same buffer
+        fresh = True
+        if self.capturing:
+            fp = zlib.crc32(frame[::16, ::16, 1].tobytes())
+            fresh = fp != self._last_fp
+            self._last_fp = fp
         
-        ret, frame = self.camera.read()
-        if not ret or frame is None:
-            return
+        # Resize straight into the preview buffer; shown as BGR, no conversion
+        if frame.shape != self._preview_src_shape:
+            self._fit_preview(frame.shape)
+        view = self._preview_view
+        cv2.resize(frame, (view.shape[1], view.shape[0]), dst=view,
+                   interpolation=cv2.INTER_AREA)
+        self.video_label.setPixmap(QPixmap.fromImage(self._qimg))
         
-        # Add text overlay
-        if self.capturing:
-            cv2.putText(frame, "CAPTURING...", (10, 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-            cv2.putText(frame, f"Frame: {self.frames_captured}/{self.frames_to_capture}", (10, 70),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-        
-        # Convert and display
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_frame.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        pixmap = QPixmap.fromImage(qt_image)
-        scaled = pixmap.scaled(self.video_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.video_label.setPixmap(scaled)
-        
-        # Capture frames if active
-        if self.capturing and self.extractor:
-            try:
-                embedding = self.extractor.extract_from_frame(rgb_frame)
-                if embedding is not None:
-                    self.embeddings.append(embedding)
-                    self.frames_captured += 1
-                    self.progress_bar.setValue(self.frames_captured)
-                    
-                    if self.frames_captured >= self.frames_to_capture:
-                        self._finish_capture()
-            except Exception as e:
-                print(f"Error capturing frame: {e}")
+        # Hand new frames to the extractor thread if capturing
+        if self.capturing and fresh and self.extractor_thread:
+            # The model was trained on RGB input
+            self.extractor_thread.submit(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
     
-    def _start_capture(self):
-        """Start capturing gesture frames."""
-        # Validate inputs
-        name = self.name_input.text().strip()
-        letter = self.letter_input.text().strip()
+    def _fit_preview(self, shape):
+        """Pick the centred region of the preview buffer that keeps the
+        aspect ratio of frames with the given shape."""
+        h, w = shape[:2]
+        scale = min(PREVIEW_WIDTH / w, PREVIEW_HEIGHT / h)
+        fit_w = max(1, round(w * scale))
+        fit_h = max(1, round(h * scale))
+        x = (PREVIEW_WIDTH - fit_w) // 2
+        y = (PREVIEW_HEIGHT - fit_h) // 2
         
-        if not name:
-            QMessageBox.warning(self, "Invalid Input", "Please enter a gesture name.")
-            return
+        self._preview_buf[:] = 0  # Black bars
+        self._preview_view = self._preview_buf[y:y + fit_h, x:x + fit_w]
+        self._preview_src_shape = shape
+    
+    def _on_embedding(self, embedding):
+        """Store an embedding produced by the extractor thread."""
+        if not self.capturing:
+            return  # Late result after capture finished
         
-        if not letter or len(letter) != 1:
-            QMessageBox.warning(self, "Invalid Input", "Please enter a single letter.")
-            return
+        self._emb_buf[self.frames_captured] = embedding
+        self.frames_captured += 1
+        self.progress_bar.setValue(self.frames_captured)
+        self._update_overlay()
         
-        if letter in self.existing_letters:
-            QMessageBox.warning(self, "Duplicate Letter", 
-                              f"Letter '{letter}' is already assigned.\nPlease choose another.")
+        if self.frames_captured >= self.frames_to_capture:
+            self._finish_capture()
+    
+    def _update_start_enabled(self):
+        """Enable capture only when name and a free letter are entered."""
+        if self.capturing:
             return
         
-        # Start capture
-        self.embeddings = []
+        name = self.name_input.text().strip()
+        letter = self.letter_input.text()
+        duplicate = letter in self.existing_letters
+        
+        valid = bool(name and letter and not duplicate)
+        self.capture_btn.setEnabled(valid and self.extractor is not None)
+        if self.frames_captured:
+            self.save_btn.setEnabled(valid)
+        if duplicate:
+            self.status_label.setText(f"Letter '{letter}' is already assigned. Please choose another.")
+        elif not self.extractor:
+            self.status_label.setText("Gesture model failed to load")
+        else:
+            self.status_label.setText("Ready to capture")
+    
+    def _start_capture(self):
+        """Start capturing gesture frames."""
+        # Inputs are validated by _update_start_enabled before the button is enabled
+        self._emb_buf = np.empty((self.frames_to_capture, self.extractor.dim), dtype=np.float32)
         self.frames_captured = 0
+        self._last_fp = None
         self.capturing = True
         self.capture_btn.setEnabled(False)
+        self.frame_count_spin.setEnabled(False)  # Buffer is sized for this count
+        self.name_input.setEnabled(False)  # Validated above; frozen until capture ends
+        self.letter_input.setEnabled(False)
         self.status_label.setText("Capturing... Hold your gesture steady!")
         self.progress_bar.setValue(0)
+        self._update_overlay()
+        self.overlay_label.show()
+    
+    def _update_overlay(self):
+        """Refresh the capture overlay text."""
+        self.overlay_label.setText(
+            f"CAPTURING...\nFrame: {self.frames_captured}/{self.frames_to_capture}"
+        )
+        self.overlay_label.adjustSize()
     
     def _finish_capture(self):
         """Finish capturing and enable save."""
         self.capturing = False
-        self.capture_btn.setEnabled(True)
-        self.save_btn.setEnabled(True)
-        self.status_label.setText(f"Captured {self.frames_captured} frames! Click 'Save Gesture' to finish.")
+        self.overlay_label.hide()
+        self.name_input.setEnabled(True)
+        self.letter_input.setEnabled(True)
+        self.frame_count_spin.setEnabled(True)
+        self._update_start_enabled()  # Enables save only for a valid name and letter
+        if self.save_btn.isEnabled():
+            self.status_label.setText(f"Captured {self.frames_captured} frames! Click 'Save Gesture' to finish.")
     
     def get_gesture_data(self):
         """Get captured gesture data."""
         return {
             'name': self.name_input.text().strip(),
             'letter': self.letter_input.text().strip(),
-            'embeddings': self.embeddings
+            'embeddings': self._emb_buf[:self.frames_captured] if self._emb_buf is not None else []
         }
     
     def _release_camera(self):
         """Release camera resources."""
-        self.preview_timer.stop()
+        if self.grabber_thread:
+            self.grabber_thread.stop()
+            self.grabber_thread = None
+        
+        if self.extractor_thread:
+            self.extractor_thread.stop()
+            self.extractor_thread = None
         
         # Release camera to turn off hardware
         if self.camera and self.camera.isOpened():
@@ -8,49 +8,97 @@ import numpy as np
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QLineEdit, QMessageBox, QProgressBar,
                                QListWidget, QSpinBox)
-from PySide6.QtCore import QTimer, Qt, Signal, QThread
-from PySide6.QtGui import QFont
+from PySide6.QtCore import (QTimer, Qt, Signal, QThread, QMutex, QWaitCondition,
+                            QRegularExpression)
+from PySide6.QtGui import QFont, QRegularExpressionValidator
 
 from core.voice_trainer import VoiceTrainer
 from config import VOICE_TRAINING_SAMPLES_RECOMMENDED, VOICE_TRAINING_DURATION, DEBUG
 
 
-class RecordingThread(QThread):
-    """Thread for recording audio without blocking UI."""
-    finished = Signal(object)  # Emits audio data when done
+class RecordingWorker(QThread):
+    """Persistent worker that records samples from one open input stream."""
+    finished = Signal(object, object)  # Emits (audio data, embedding) when a sample is done
     error = Signal(str)  # Emits error message if recording fails
     
-    def __init__(self, trainer):
+    def __init__(self, trainer, voice_model):
         super().__init__()
         self.trainer = trainer
+        self.voice_model = voice_model
+        self._mutex = QMutex()
+        self._go = QWaitCondition()
+        self._pending = False
+        self._stopping = False
+    
+    def request_sample(self):
+        """Ask the worker to record the next sample."""
+        self._mutex.lock()
+        self._pending = True
+        self._go.wakeAll()
+        self._mutex.unlock()
+    
+    def stop(self):
+        """Stop the worker and close the stream."""
+        self._mutex.lock()
+        self._stopping = True
+        self._go.wakeAll()
+        self._mutex.unlock()
+        self.wait()
     
     def run(self):
-        """Run recording in background thread."""
+        """Open the stream once, then record a sample per request."""
         if DEBUG:
-            print("DEBUG: RecordingThread.run() started")
+            print("DEBUG: RecordingWorker.run() started")
         try:
-            audio_data = self.trainer.record_sample()
+            self.trainer.open_stream()
+        except Exception as e:
+            # Retried by record_from_stream() on the first request
             if DEBUG:
-                print(f"DEBUG: record_sample() returned: {type(audio_data)}, length: {len(audio_data) if audio_data is not None else 'None'}")
+                print(f"DEBUG: Opening input stream failed: {e}")
+        
+        try:
+            while True:
+                self._mutex.lock()
+                while not self._pending and not self._stopping:
+                    self._go.wait(self._mutex)
+                stopping = self._stopping
+                self._pending = False
+                self._mutex.unlock()
+                if stopping:
+                    break
+                self._record_one()
+        finally:
+            self.trainer.close_stream()
+    
+    def _record_one(self):
+        """Record one sample, embed it and emit the result."""
+        try:
+            audio_data = self.trainer.record_from_stream()
+            if DEBUG:
+                print(f"DEBUG: record_from_stream() returned: {type(audio_data)}, length: {len(audio_data) if audio_data is not None else 'None'}")
             
             if audio_data is None:
                 error_msg = "Recording failed: No audio data received. Check microphone connection and permissions."
                 if DEBUG:
                     print(f"DEBUG: {error_msg}")
                 self.error.emit(error_msg)
-                self.finished.emit(None)
+                self.finished.emit(None, None)
             else:
+                # Inference runs here so the GUI thread never blocks on it
+                embedding = self.trainer.audio_to_embedding(audio_data, self.voice_model)
                 if DEBUG:
-                    print("DEBUG: Emitting finished signal with audio data")
-                self.finished.emit(audio_data)
+                    print("DEBUG: Emitting finished signal with audio data and embedding")
+                self.finished.emit(audio_data, embedding)
         except Exception as e:
             error_msg = f"Recording error: {str(e)}"
             if DEBUG:
-                print(f"DEBUG: Exception in run(): {error_msg}")
+                print(f"DEBUG: Exception in worker: {error_msg}")
                 import traceback
                 traceback.print_exc()
+            # Reopen the device on the next request
+            self.trainer.close_stream()
             self.error.emit(error_msg)
-            self.finished.emit(None)  # Emit None to indicate failure
+            self.finished.emit(None, None)  # Emit None to indicate failure
 
 
 class CustomVoiceDialog(QDialog):
@@ -60,11 +108,11 @@ class CustomVoiceDialog(QDialog):
         super().__init__(parent)
         self.voice_model = voice_model
         
-        # Ensure existing_letters is a set or list
-        if isinstance(existing_letters, (set, list)):
-            self.existing_letters = existing_letters if isinstance(existing_letters, set) else set(existing_letters)
+        # Ensure existing_letters is a frozenset (O(1) lookups per keystroke)
+        if isinstance(existing_letters, (set, frozenset, list, tuple)):
+            self.existing_letters = frozenset(existing_letters)
         else:
-            self.existing_letters = set()
+            self.existing_letters = frozenset()
         
         # Ensure existing_names is a list
         if isinstance(existing_names, list):
@@ -75,11 +123,15 @@ class CustomVoiceDialog(QDialog):
             # If it's not a list, treat as empty (defensive programming)
             print(f"WARNING: existing_names should be a list, got {type(existing_names)}. Using empty list.")
             self.existing_names = []
+        self._existing_names_lower = frozenset(n.lower() for n in self.existing_names)
         
         self.trainer = VoiceTrainer()
-        self.embeddings = []
+        self._emb_buf = None  # (max samples, embedding dim) float32, allocated on first sample
+        self._n_samples = 0
         self.audio_samples = []  # Store raw audio for playback
-        self.recording_thread = None
+        self.recording_worker = None  # Created on first recording
+        self._recording = False
+        self._input_hint = False  # status_label currently shows an input problem
         
         self.setWindowTitle("Create Custom Voice Command")
         self.setMinimumSize(500, 650)
@@ -111,6 +163,7 @@ class CustomVoiceDialog(QDialog):
         self.letter_input = QLineEdit()
         self.letter_input.setMaxLength(1)
         self.letter_input.setPlaceholderText("Single letter")
+        self.letter_input.setValidator(QRegularExpressionValidator(QRegularExpression(r"\S")))
         letter_layout.addWidget(self.letter_input)
         layout.addLayout(letter_layout)
         
@@ -129,6 +182,7 @@ class CustomVoiceDialog(QDialog):
         # Recording button
         self.record_btn = QPushButton(f"🎤 Record Sample ({VOICE_TRAINING_DURATION}s)")
         self.record_btn.setStyleSheet("background-color: #d9534f; font-size: 14px; padding: 10px;")
+        self.record_btn.setEnabled(False)
         self.record_btn.clicked.connect(self._start_recording)
         layout.addWidget(self.record_btn)
         
@@ -193,6 +247,9 @@ class CustomVoiceDialog(QDialog):
         
         layout.addLayout(btn_layout)
         self.setLayout(layout)
+        
+        self.name_input.textChanged.connect(self._update_start_enabled)
+        self.letter_input.textChanged.connect(self._update_start_enabled)
     
     def _update_instructions(self):
         """Update instructions based on current settings."""
@@ -213,6 +270,32 @@ class CustomVoiceDialog(QDialog):
         """Handle sample count change."""
         self.progress_bar.setMaximum(value)
         self._update_instructions()
+        self._update_start_enabled()
+    
+    def _update_start_enabled(self):
+        """Enable recording only for a new name, a free letter and while samples are still needed."""
+        name = self.name_input.text().strip()
+        letter = self.letter_input.text()
+        duplicate_name = name.lower() in self._existing_names_lower
+        duplicate_letter = letter in self.existing_letters
+        valid = bool(name and letter and not duplicate_name and not duplicate_letter)
+        
+        sample_num = self._n_samples
+        target_samples = self.sample_count_spin.value()
+        self.record_btn.setEnabled(valid and not self._recording and sample_num < target_samples)
+        self.save_btn.setEnabled(valid and sample_num == target_samples)
+        
+        if duplicate_name or duplicate_letter:
+            if duplicate_name:
+                self.status_label.setText(f"Command name '{name}' already exists")
+            else:
+                self.status_label.setText(f"Letter '{letter}' is already assigned")
+            self.status_label.setStyleSheet("color: #d9534f; font-weight: bold;")
+            self._input_hint = True
+        elif self._input_hint:
+            self.status_label.setText("Ready to record")
+            self.status_label.setStyleSheet("color: #5cb85c; font-weight: bold;")
+            self._input_hint = False
     
     def _on_sample_selected(self):
         """Handle sample selection."""
@@ -225,75 +308,31 @@ class CustomVoiceDialog(QDialog):
         if DEBUG:
             print("DEBUG: _start_recording called")
         
-        # Check if we've reached the limit
-        target_samples = self.sample_count_spin.value()
-        if len(self.embeddings) >= target_samples:
-            QMessageBox.warning(
-                self, 
-                "Limit Reached", 
-                f"You have already recorded {target_samples} samples.\n"
-                "Remove some samples if you want to record new ones."
-            )
-            return
-        
-        # Validate inputs
-        name = self.name_input.text().strip()
-        letter = self.letter_input.text().strip()
-        
+        # Inputs and sample count are validated by _update_start_enabled
+        # before the button is enabled
         if DEBUG:
-            print(f"DEBUG: name='{name}', letter='{letter}'")
-        
-        if not name:
-            QMessageBox.warning(self, "Invalid Input", "Please enter a command name.")
-            return
-        
-        # Check for duplicate name
-        if name.lower() in [n.lower() for n in self.existing_names]:
-            QMessageBox.warning(
-                self, 
-                "Duplicate Name", 
-                f"Command name '{name}' already exists.\nPlease choose a different name."
-            )
-            return
-        
-        if not letter or len(letter) != 1:
-            QMessageBox.warning(self, "Invalid Input", "Please enter a single letter.")
-            return
-        
-        if letter in self.existing_letters:
-            QMessageBox.warning(
-                self, 
-                "Duplicate Letter", 
-                f"Letter '{letter}' is already assigned.\nPlease choose another."
-            )
-            return
-        
-        # Check if previous thread is still running
-        if self.recording_thread and self.recording_thread.isRunning():
-            QMessageBox.warning(self, "Recording in Progress", "Please wait for the current recording to finish.")
-            return
-        
-        if DEBUG:
-            print("DEBUG: Starting recording thread...")
+            print("DEBUG: Requesting sample from recording worker...")
         
         # Disable button during recording
+        self._recording = True
         self.record_btn.setEnabled(False)
         self.status_label.setText("🔴 Recording... Speak now!")
         self.status_label.setStyleSheet("color: #d9534f; font-weight: bold;")
         
-        # Start recording in background thread
-        self.recording_thread = RecordingThread(self.trainer)
-        self.recording_thread.finished.connect(self._on_recording_finished)
-        self.recording_thread.error.connect(self._on_recording_error)
-        if DEBUG:
-            print("DEBUG: Thread created, starting...")
-        self.recording_thread.start()
-        if DEBUG:
-            print("DEBUG: Thread started")
+        # One worker per dialog keeps the input device open between samples
+        if self.recording_worker is None:
+            self.recording_worker = RecordingWorker(self.trainer, self.voice_model)
+            self.recording_worker.finished.connect(self._on_recording_finished)
+            self.recording_worker.error.connect(self._on_recording_error)
+            self.recording_worker.start()
+            if DEBUG:
+                print("DEBUG: Recording worker started")
+        self.recording_worker.request_sample()
     
     def _on_recording_error(self, error_msg):
         """Handle recording error."""
-        self.record_btn.setEnabled(True)
+        self._recording = False
+        self._update_start_enabled()
         self.status_label.setText(f"❌ Error: {error_msg}")
         self.status_label.setStyleSheet("color: #d9534f; font-weight: bold;")
         QMessageBox.critical(
@@ -302,11 +341,12 @@ class CustomVoiceDialog(QDialog):
             f"Failed to record audio:\n\n{error_msg}\n\nPlease check your microphone settings."
         )
     
-    def _on_recording_finished(self, audio_data):
-        """Handle completed recording."""
+    def _on_recording_finished(self, audio_data, embedding):
+        """Handle a completed recording and its precomputed embedding."""
         if DEBUG:
             print(f"DEBUG: _on_recording_finished called with audio_data: {audio_data is not None}")
-        self.record_btn.setEnabled(True)
+        self._recording = False
+        self._update_start_enabled()
         
         if audio_data is None:
             # Error was already handled by _on_recording_error, but update status if needed
@@ -315,31 +355,32 @@ class CustomVoiceDialog(QDialog):
                 self.status_label.setStyleSheet("color: #d9534f; font-weight: bold;")
             return
         
-        # Convert to embedding
-        embedding = self.trainer.audio_to_embedding(audio_data, self.voice_model)
-        
         if embedding is None:
             self.status_label.setText("❌ Failed to process audio!")
             self.status_label.setStyleSheet("color: #d9534f; font-weight: bold;")
             return
         
         # Store both embedding and raw audio
-        self.embeddings.append(embedding)
+        if self._emb_buf is None:
+            self._emb_buf = np.empty(
+                (self.sample_count_spin.maximum(), embedding.size), dtype=np.float32
+            )
+        self._emb_buf[self._n_samples] = embedding.ravel()
+        self._n_samples += 1
         self.audio_samples.append(audio_data)
         
         # Update UI
-        sample_num = len(self.embeddings)
+        sample_num = self._n_samples
         self.samples_list.addItem(f"Sample {sample_num} - {time.strftime('%H:%M:%S')}")
         self.progress_bar.setValue(sample_num)
         self.progress_label.setText(f"Samples recorded: {sample_num}")
+        self._update_start_enabled()
         
         target_samples = self.sample_count_spin.value()
         
         if sample_num >= target_samples:
             self.status_label.setText(f"✅ All {sample_num} samples recorded! Ready to save.")
             self.status_label.setStyleSheet("color: #5cb85c; font-weight: bold;")
-            self.save_btn.setEnabled(True)
-            self.record_btn.setEnabled(False)  # Disable further recording
         else:
             remaining = target_samples - sample_num
             self.status_label.setText(f"✅ Sample {sample_num} recorded! {remaining} more needed.")
@@ -369,24 +410,24 @@ class CustomVoiceDialog(QDialog):
         current_row = self.samples_list.currentRow()
         if current_row >= 0:
             self.samples_list.takeItem(current_row)
-            del self.embeddings[current_row]
+            # Shift later rows up to keep them aligned with the list
+            n = self._n_samples
+            self._emb_buf[current_row:n - 1] = self._emb_buf[current_row + 1:n]
+            self._n_samples -= 1
             del self.audio_samples[current_row]
             
             # Update progress
-            sample_num = len(self.embeddings)
+            sample_num = self._n_samples
             self.progress_bar.setValue(sample_num)
             self.progress_label.setText(f"Samples recorded: {sample_num}")
             
             # Re-enable recording if below target
-            target_samples = self.sample_count_spin.value()
-            if sample_num < target_samples:
-                self.record_btn.setEnabled(True)
-                self.save_btn.setEnabled(False)
+            self._update_start_enabled()
     
     def _validate_and_save(self):
         """Validate before saving."""
         target_samples = self.sample_count_spin.value()
-        actual_samples = len(self.embeddings)
+        actual_samples = self._n_samples
         
         if actual_samples != target_samples:
             QMessageBox.warning(
@@ -404,5 +445,26 @@ class CustomVoiceDialog(QDialog):
         return {
             'name': self.name_input.text().strip(),
             'letter': self.letter_input.text().strip(),
-            'embeddings': self.embeddings
-        }
\ No newline at end of file
+            'embeddings': self._emb_buf[:self._n_samples].copy() if self._emb_buf is not None else []
+        }
+    
+    def _stop_recorder(self):
+        """Stop the recording worker and close the input stream."""
+        if self.recording_worker:
+            self.recording_worker.stop()
+            self.recording_worker = None
+    
+    def accept(self):
+        """Handle dialog acceptance - close the input stream first."""
+        self._stop_recorder()
+        super().accept()
+    
+    def reject(self):
+        """Handle dialog rejection - close the input stream first."""
+        self._stop_recorder()
+        super().reject()
+    
+    def closeEvent(self, event):
+        """Close the input stream on close."""
+        self._stop_recorder()
+        event.accept()
\ No newline at end of file
@@ -3,22 +3,48 @@ Main UI window for robot controller.
 """
 
 import time
+from collections import deque
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                               QGroupBox, QPushButton, QLabel, QTextEdit, QMessageBox,
-                               QMenuBar, QMenu)
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont, QAction
+                               QGroupBox, QPushButton, QLabel, QPlainTextEdit,
+                               QMessageBox, QMenuBar, QMenu)
+from PySide6.QtCore import Qt, QTimer, QEvent
+from PySide6.QtGui import QFont, QAction, QColor, QTextCharFormat, QTextCursor
 
 from config import (WINDOW_TITLE, WINDOW_WIDTH, WINDOW_HEIGHT, 
                    MODE_KEYBOARD, MODE_VOICE, MODE_GESTURE,
-                   STOP_DRIVE, STOP_ARM1, STOP_ARM2, STOP_ARM3, TOGGLE_LED, STOP_ALL)
+                   STOP_DRIVE, STOP_ARM1, STOP_ARM2, STOP_ARM3, TOGGLE_LED, STOP_ALL,
+                   MAX_LOG_LINES, LOG_FLUSH_INTERVAL_MS, INDICATOR_UPDATE_INTERVAL_MS)
 from .video_display import VideoDisplay
 from .bluetooth_panel import BluetoothPanel
 from .control_panel import ControlPanel
-from .model_config_dialog import ModelConfigDialog
 from utils.logger import get_log_color, LogLevel
 
 
+_TIMESTAMP_FMT = "%H:%M:%S"
+
+# Connection status label (text, style) per state
+_STATUS_CONNECTED = ("🟢 Connected", "color: #00ff88; font-weight: bold;")
+_STATUS_DISCONNECTED = ("🔴 Disconnected", "color: #ff4444; font-weight: bold;")
+
+# Keyboard mode: key -> (command, active_cmds slot) on press
+_PRESS_MAP = {
+    Qt.Key_W: ('F', 'drive'),  # Drive (WASD)
+    Qt.Key_S: ('B', 'drive'),
+    Qt.Key_A: ('L', 'drive'),
+    Qt.Key_D: ('R', 'drive'),
+    Qt.Key_1: ('Z', 'arm1'),  # Arm 1 (1 / 4)
+    Qt.Key_4: ('A', 'arm1'),
+    Qt.Key_3: ('S', 'arm2'),  # Arm 2 (3 / 6)
+    Qt.Key_6: ('X', 'arm2'),
+    Qt.Key_0: ('C', 'arm3'),  # Arm 3 (0 / 2)
+    Qt.Key_2: ('V', 'arm3'),
+}
+# Key -> (stop command, active_cmds slot) on release
+_RELEASE_MAP = {key: ({'drive': STOP_DRIVE, 'arm1': STOP_ARM1, 'arm2': STOP_ARM2,
+                       'arm3': STOP_ARM3}[cmd_type], cmd_type)
+                for key, (_, cmd_type) in _PRESS_MAP.items()}
+
+
 class RobotControlUI(QMainWindow):
     """Main UI window for robot control."""
     
@@ -27,15 +53,31 @@ class RobotControlUI(QMainWindow):
         self.backend = backend
         self.signals = backend.signals
         
-        # Connect signals
-        self.signals.log_signal.connect(self.add_log)
-        self.signals.frame_signal.connect(self.update_video)
+        # Log lines are queued here and appended to the widget in batches
+        self._log_buf = deque(maxlen=MAX_LOG_LINES)  # (char format, text) pairs
+        # Text color for each log level string, e.g. "error" -> red
+        self._log_formats = {}
+        for lvl in LogLevel:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(get_log_color(lvl)))
+            self._log_formats[lvl.value] = fmt
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_logs)
+        
+        self._last_status = None  # Last status applied to connection_status
+        self._kbd_enabled = True  # Keyboard control active; kept in sync by update_mode_display
+        
+        # Connect signals. Log and command signals mostly come from the
+        # voice/gesture worker threads, so they are queued explicitly.
+        self.signals.log_signal.connect(self.add_log, Qt.QueuedConnection)
         self.signals.mode_signal.connect(self.update_mode_display)
         self.signals.status_signal.connect(self.update_status)
-        self.signals.voice_command_signal.connect(self.show_voice_command)
-        self.signals.gesture_command_signal.connect(self.show_gesture_command)
+        self.signals.voice_command_signal.connect(self.show_voice_command, Qt.QueuedConnection)
+        self.signals.gesture_command_signal.connect(self.show_gesture_command, Qt.QueuedConnection)
         
         self.init_ui()
+        self._log_timer.start()
         self.add_log("UI initialized", "success")
     
     def init_ui(self):
@@ -56,6 +98,8 @@ class RobotControlUI(QMainWindow):
         
         # Video display
         self.video_display = VideoDisplay()
+        # emit_frame already hops to the GUI thread and drops stale frames
+        self.signals.frame_signal.connect(self.video_display.update_frame)
         left_panel.addWidget(self.video_display)
         
         # Status bar
@@ -92,6 +136,7 @@ class RobotControlUI(QMainWindow):
     
     def _open_model_config(self):
         """Open model configuration dialog."""
+        from .model_config_dialog import ModelConfigDialog
         dialog = ModelConfigDialog(self.backend, self)
         dialog.exec()
     
@@ -115,27 +160,52 @@ class RobotControlUI(QMainWindow):
             status_group.setMinimumHeight(80)  # Ensure enough space
             layout = QHBoxLayout()
             
+            # Shared by the labels below (setFont copies). Built here rather
+            # than at import time, which is before the QApplication exists.
+            bold_font = QFont("Arial", 11, QFont.Bold)
+            indicator_font = QFont("Arial", 10)
+            
             self.connection_status = QLabel("🔴 Disconnected")
-            self.connection_status.setFont(QFont("Arial", 11, QFont.Bold))
+            self.connection_status.setFont(bold_font)
             self.connection_status.setMinimumWidth(150)
             layout.addWidget(self.connection_status)
             
             self.mode_display = QLabel(f"Mode: {MODE_KEYBOARD}")
-            self.mode_display.setFont(QFont("Arial", 11, QFont.Bold))
+            self.mode_display.setFont(bold_font)
             self.mode_display.setStyleSheet("color: #00ff88;")
             self.mode_display.setMinimumWidth(150)
             layout.addWidget(self.mode_display)
             
             self.voice_indicator = QLabel("")
-            self.voice_indicator.setFont(QFont("Arial", 10))
+            self.voice_indicator.setFont(indicator_font)
             self.voice_indicator.setMinimumWidth(120)
             layout.addWidget(self.voice_indicator)
             
             self.gesture_indicator = QLabel("")
-            self.gesture_indicator.setFont(QFont("Arial", 10))
+            self.gesture_indicator.setFont(indicator_font)
             self.gesture_indicator.setMinimumWidth(120)
             layout.addWidget(self.gesture_indicator)
             
+            # One reusable timer per indicator; start() restarts it on each command
+            self._voice_clear_timer = QTimer(self)
+            self._voice_clear_timer.setSingleShot(True)
+            self._voice_clear_timer.setInterval(2000)
+            self._voice_clear_timer.timeout.connect(self._clear_voice_indicator)
+            
+            self._gesture_clear_timer = QTimer(self)
+            self._gesture_clear_timer.setSingleShot(True)
+            self._gesture_clear_timer.setInterval(2000)
+            self._gesture_clear_timer.timeout.connect(self._clear_gesture_indicator)
+            
+            # Recognitions are coalesced: only the latest text per indicator
+            # is shown, at most once per INDICATOR_UPDATE_INTERVAL_MS
+            self._voice_pending = None
+            self._gesture_pending = None
+            self._indicator_timer = QTimer(self)
+            self._indicator_timer.setSingleShot(True)
+            self._indicator_timer.setInterval(INDICATOR_UPDATE_INTERVAL_MS)
+            self._indicator_timer.timeout.connect(self._apply_indicators)
+            
             layout.addStretch()
             status_group.setLayout(layout)
             return status_group
@@ -148,31 +218,45 @@ class RobotControlUI(QMainWindow):
         self.keyboard_btn = QPushButton("⌨️ Keyboard Control")
         self.keyboard_btn.setCheckable(True)
         self.keyboard_btn.setChecked(True)
-        self.keyboard_btn.clicked.connect(lambda: self.backend.switch_mode(MODE_KEYBOARD))
+        self.keyboard_btn.clicked.connect(self._set_keyboard_mode)
         layout.addWidget(self.keyboard_btn)
         
         self.voice_btn = QPushButton("🎤 Voice Control")
         self.voice_btn.setCheckable(True)
-        self.voice_btn.clicked.connect(lambda: self.backend.switch_mode(MODE_VOICE))
+        self.voice_btn.clicked.connect(self._set_voice_mode)
         layout.addWidget(self.voice_btn)
         
         self.gesture_btn = QPushButton("👋 Gesture Control")
         self.gesture_btn.setCheckable(True)
-        self.gesture_btn.clicked.connect(lambda: self.backend.switch_mode(MODE_GESTURE))
+        self.gesture_btn.clicked.connect(self._set_gesture_mode)
         layout.addWidget(self.gesture_btn)
         
         mode_group.setLayout(layout)
         return mode_group
     
+    def _set_keyboard_mode(self):
+        """Switch to keyboard control."""
+        self.backend.switch_mode(MODE_KEYBOARD)
+    
+    def _set_voice_mode(self):
+        """Switch to voice control."""
+        self.backend.switch_mode(MODE_VOICE)
+    
+    def _set_gesture_mode(self):
+        """Switch to gesture control."""
+        self.backend.switch_mode(MODE_GESTURE)
+    
     def _create_info_panel(self):
         """Create command info panel."""
         info_group = QGroupBox("ℹ️ Quick Reference    ")
         layout = QVBoxLayout()
         
-        info_text = QTextEdit()
-        info_text.setReadOnly(True)
+        # Static text: a QLabel renders the HTML without an editor document
+        info_text = QLabel()
+        info_text.setTextFormat(Qt.RichText)
+        info_text.setWordWrap(True)
         info_text.setMaximumHeight(150)
-        info_text.setHtml("""
+        info_text.setText("""
         <b>Dynamic Models:</b><br>
         Use <b>Models → Configure Models</b> to load new models and assign letters to classes.<br><br>
         <b>Keyboard (WASD + Number Pad):</b><br>
@@ -188,9 +272,11 @@ class RobotControlUI(QMainWindow):
         log_group = QGroupBox("📝 Activity Log    ")
         layout = QVBoxLayout()
         
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(MAX_LOG_LINES)  # Drops oldest lines
         self.log_display.setMaximumHeight(200)
+        self.log_display.installEventFilter(self)  # Catch up on lines queued while hidden
         layout.addWidget(self.log_display)
         
         log_group.setLayout(layout)
@@ -201,62 +287,86 @@ class RobotControlUI(QMainWindow):
     # ========================================================
     
     def add_log(self, message, level="info"):
-        """Add log message with color coding."""
-        try:
-            log_level = LogLevel(level)
-        except ValueError:
-            log_level = LogLevel.INFO
-        
-        color = get_log_color(log_level)
-        timestamp = time.strftime("%H:%M:%S")
-        self.log_display.append(
-            f'<span style="color:{color};">[{timestamp}] {message}</span>'
-        )
-        
-        # Limit log history to prevent memory issues (keep last 1000 lines)
-        from config import MAX_LOG_LINES
-        from PySide6.QtGui import QTextCursor
-        block_count = self.log_display.document().blockCount()
-        if block_count > MAX_LOG_LINES:
-            cursor = QTextCursor(self.log_display.document())
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            # Move to the line we want to keep (remove everything before this)
-            lines_to_remove = block_count - MAX_LOG_LINES
-            for _ in range(lines_to_remove):
-                cursor.movePosition(QTextCursor.MoveOperation.Down, QTextCursor.MoveMode.KeepAnchor)
-            cursor.removeSelectedText()
-        
+        """Queue a color-coded log message; shown on the next flush."""
+        fmt = self._log_formats.get(level) or self._log_formats[LogLevel.INFO.value]
+        timestamp = time.strftime(_TIMESTAMP_FMT)
+        self._log_buf.append((fmt, f"[{timestamp}] {message}"))
+    
+    def _flush_logs(self):
+        """Append all queued log lines to the log display in one go."""
+        # While hidden, lines keep queueing (capped by the deque) until shown
+        if not self._log_buf or not self.log_display.isVisible():
+            return
+        lines = list(self._log_buf)
+        self._log_buf.clear()
+        # Plain text with a per-level char format, no HTML parsing. One block
+        # per line so setMaximumBlockCount still counts lines.
+        cursor = self.log_display.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for fmt, text in lines:
+            if not self.log_display.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(text, fmt)
+        cursor.endEditBlock()
+        self.log_display.setTextCursor(cursor)
         self.log_display.ensureCursorVisible()
     
-    def update_video(self, frame):
-        """Update live video feed."""
-        self.video_display.update_frame(frame)
+    def eventFilter(self, obj, event):
+        """Flush queued log lines as soon as the log display is shown."""
+        if obj is self.log_display and event.type() == QEvent.Show:
+            self._flush_logs()
+        return super().eventFilter(obj, event)
     
     def update_mode_display(self, mode):
         """Update current control mode display."""
         self.mode_display.setText(f"Mode: <b>{mode}</b>")
+        self._kbd_enabled = mode == MODE_KEYBOARD
         self.keyboard_btn.setChecked(mode == MODE_KEYBOARD)
         self.voice_btn.setChecked(mode == MODE_VOICE)
         self.gesture_btn.setChecked(mode == MODE_GESTURE)
     
     def update_status(self, status):
         """Update connection status indicator."""
-        if status == "Connected":
-            self.connection_status.setText("🟢 Connected")
-            self.connection_status.setStyleSheet("color: #00ff88; font-weight: bold;")
-        else:
-            self.connection_status.setText("🔴 Disconnected")
-            self.connection_status.setStyleSheet("color: #ff4444; font-weight: bold;")
+        # Repeated statuses would only re-parse the same style sheet
+        if status == self._last_status:
+            return
+        self._last_status = status
+        
+        text, style = _STATUS_CONNECTED if status == "Connected" else _STATUS_DISCONNECTED
+        self.connection_status.setText(text)
+        self.connection_status.setStyleSheet(style)
     
     def show_voice_command(self, command, confidence):
         """Show recognized voice command."""
-        self.voice_indicator.setText(f"🎤 {command} ({confidence:.2f})")
-        QTimer.singleShot(2000, lambda: self.voice_indicator.setText(""))
+        self._voice_pending = f"🎤 {command} ({confidence:.2f})"
+        if not self._indicator_timer.isActive():
+            self._indicator_timer.start()
     
     def show_gesture_command(self, gesture, confidence):
         """Show recognized gesture command."""
-        self.gesture_indicator.setText(f"👋 {gesture} ({confidence:.2f})")
-        QTimer.singleShot(2000, lambda: self.gesture_indicator.setText(""))
+        self._gesture_pending = f"👋 {gesture} ({confidence:.2f})"
+        if not self._indicator_timer.isActive():
+            self._indicator_timer.start()
+    
+    def _apply_indicators(self):
+        """Show the latest pending voice/gesture commands."""
+        if self._voice_pending:
+            self.voice_indicator.setText(self._voice_pending)
+            self._voice_pending = None
+            self._voice_clear_timer.start()
+        if self._gesture_pending:
+            self.gesture_indicator.setText(self._gesture_pending)
+            self._gesture_pending = None
+            self._gesture_clear_timer.start()
+    
+    def _clear_voice_indicator(self):
+        """Clear the recognized voice command."""
+        self.voice_indicator.setText("")
+    
+    def _clear_gesture_indicator(self):
+        """Clear the recognized gesture command."""
+        self.gesture_indicator.setText("")
     
     # ========================================================
     #                  KEYBOARD CONTROL
@@ -264,74 +374,30 @@ class RobotControlUI(QMainWindow):
     
     def keyPressEvent(self, event):
         """Handle keyboard press for robot control."""
-        if self.backend.current_mode != MODE_KEYBOARD:
+        if not self._kbd_enabled:
             return super().keyPressEvent(event)
         
         key = event.key()
-        cmd = None
-        cmd_type = None
-        
-        # Drive controls (WASD)
-        if key == Qt.Key_W:
-            cmd, cmd_type = 'F', 'drive'
-        elif key == Qt.Key_S:
-            cmd, cmd_type = 'B', 'drive'
-        elif key == Qt.Key_A:
-            cmd, cmd_type = 'L', 'drive'
-        elif key == Qt.Key_D:
-            cmd, cmd_type = 'R', 'drive'
-        
-        # Arm 1 (1 / 4)
-        elif key == Qt.Key_1:
-            cmd, cmd_type = 'Z', 'arm1'
-        elif key == Qt.Key_4:
-            cmd, cmd_type = 'A', 'arm1'
-        
-        # Arm 2 (3 / 6)
-        elif key == Qt.Key_3:
-            cmd, cmd_type = 'S', 'arm2'
-        elif key == Qt.Key_6:
-            cmd, cmd_type = 'X', 'arm2'
-        
-        # Arm 3 (0 / 2)
-        elif key == Qt.Key_0:
-            cmd, cmd_type = 'C', 'arm3'
-        elif key == Qt.Key_2:
-            cmd, cmd_type = 'V', 'arm3'
-        
-        # LED toggle
+        entry = _PRESS_MAP.get(key)
+        if entry:
+            cmd, cmd_type = entry
+            self.backend.active_cmds[cmd_type] = cmd
+            self.backend.send_command(cmd)
         elif key == Qt.Key_Q:
+            # LED toggle
             self.backend.send_command(TOGGLE_LED)
-            return
-        
-        # Emergency stop
         elif key == Qt.Key_Escape:
+            # Emergency stop
             self.backend.stop_all_motors()
-            return
-        
-        if cmd and cmd_type:
-            self.backend.active_cmds[cmd_type] = cmd
-            self.backend.send_command(cmd)
     
     def keyReleaseEvent(self, event):
         """Handle key release to stop motors."""
-        if self.backend.current_mode != MODE_KEYBOARD:
+        if not self._kbd_enabled:
             return super().keyReleaseEvent(event)
         
-        key = event.key()
-        stop_cmd = None
-        cmd_type = None
-        
-        if key in (Qt.Key_W, Qt.Key_S, Qt.Key_A, Qt.Key_D):
-            stop_cmd, cmd_type = STOP_DRIVE, 'drive'
-        elif key in (Qt.Key_1, Qt.Key_4):
-            stop_cmd, cmd_type = STOP_ARM1, 'arm1'
-        elif key in (Qt.Key_3, Qt.Key_6):
-            stop_cmd, cmd_type = STOP_ARM2, 'arm2'
-        elif key in (Qt.Key_0, Qt.Key_2):
-            stop_cmd, cmd_type = STOP_ARM3, 'arm3'
-        
-        if stop_cmd and cmd_type:
+        entry = _RELEASE_MAP.get(event.key())
+        if entry:
+            stop_cmd, cmd_type = entry
             # Only stop if this was the active command
             if self.backend.active_cmds.get(cmd_type):
                 self.backend.send_command(stop_cmd)
@@ -348,6 +414,7 @@ class RobotControlUI(QMainWindow):
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
         if reply == QMessageBox.Yes:
+            self.bt_panel.shutdown()
             self.backend.cleanup()
             event.accept()
         else:
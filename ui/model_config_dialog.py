@@ -2,22 +2,112 @@
 Model configuration dialog for loading models and editing mappings.
 """
 
+import os
+from collections import Counter
+
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QListWidget, QLineEdit, QMessageBox,
                                QFileDialog, QGroupBox, QTabWidget, QWidget,
-                               QTableWidget, QTableWidgetItem, QHeaderView)
-from PySide6.QtCore import Qt
+                               QTableWidget, QTableWidgetItem, QTableView, QHeaderView)
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 
 from core.model_manager import ModelManager
 
 
+class MappingTableModel(QAbstractTableModel):
+    """Class-to-letter rows shown in the current mapping tables."""
+    
+    HEADERS = ("Class Name", "Assigned Letter")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # [class name, letter] per row
+        self._letter_counts = Counter()  # Kept in step with the letter column
+    
+    def replace(self, rows):
+        """Replace all rows with (class name, letter) pairs."""
+        self.beginResetModel()
+        self._rows = [[label, letter] for label, letter in rows]
+        self._letter_counts = Counter(letter for _, letter in self._rows)
+        self.endResetModel()
+    
+    def mapping(self):
+        """Return the rows as a class->letter dictionary."""
+        return dict(self._rows)
+    
+    def duplicates(self):
+        """Return letters assigned to more than one class."""
+        return [letter for letter, count in self._letter_counts.items() if count > 1 and letter]
+    
+    def classes_for(self, letter):
+        """Return the class names assigned to a letter."""
+        return [label for label, assigned in self._rows if assigned == letter]
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of mapping rows."""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Number of columns (see HEADERS)."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Class name or letter for a cell."""
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self._rows[index.row()][index.column()]
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column titles; row numbers come from the base class."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index):
+        """Only the letter column is editable."""
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 1:
+            flags |= Qt.ItemIsEditable
+        return flags
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        """Store an edited letter; anything longer than one letter is rejected."""
+        if not index.isValid() or index.column() != 1 or role != Qt.EditRole:
+            return False
+        letter = str(value).strip()
+        if len(letter) > 1:
+            return False
+        row = self._rows[index.row()]
+        self._letter_counts[row[1]] -= 1
+        self._letter_counts[letter] += 1
+        row[1] = letter
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+
 class ModelConfigDialog(QDialog):
     """Dialog for configuring models and class-to-letter mappings."""
     
+    # Per-kind text for the custom command section of each tab
+    _TAB_TEXT = {
+        "voice": {
+            "custom_title": "Custom Voice Commands (Auto-Learn)",
+            "add": "➕ Add Custom Voice Command",
+            "remove": "➖ Remove Custom Voice",
+        },
+        "gesture": {
+            "custom_title": "Custom Gestures (Auto-Learn)",
+            "add": "➕ Add Custom Gesture",
+            "remove": "➖ Remove Custom Gesture",
+        },
+    }
+    
     def __init__(self, backend, parent=None):
         super().__init__(parent)
         self.backend = backend
         self.model_manager = ModelManager(backend.signals)
+        self._last_model_dir = ""  # Folder of the last picked model file
+        self._tables = {}  # kind -> {'model', 'view', 'label', 'list'}
         self.setWindowTitle("Model Configuration")
         self.setMinimumSize(700, 600)
         self._init_ui()
@@ -28,8 +118,8 @@ class ModelConfigDialog(QDialog):
         
         # Tabs for Voice and Gesture
         tabs = QTabWidget()
-        tabs.addTab(self._create_voice_tab(), "Voice Models")
-        tabs.addTab(self._create_gesture_tab(), "Gesture Models")
+        tabs.addTab(self._create_tab("voice"), "Voice Models")
+        tabs.addTab(self._create_tab("gesture"), "Gesture Models")
         layout.addWidget(tabs)
         
         # Close button
@@ -39,153 +129,111 @@ class ModelConfigDialog(QDialog):
         
         self.setLayout(layout)
     
-    def _create_voice_tab(self):
-        """Create voice model configuration tab."""
-        widget = QWidget()
-        layout = QVBoxLayout()
-        
-        # Load new model section FIRST (to match gesture tab for UI symmetry)
-        load_group = QGroupBox("Load New Voice Model")
-        load_layout = QVBoxLayout()
-        
-        btn_layout = QHBoxLayout()
-        self.voice_load_btn = QPushButton("Load .tflite and labels.txt")
-        self.voice_load_btn.clicked.connect(lambda: self._load_new_model("voice"))
-        btn_layout.addWidget(self.voice_load_btn)
-        load_layout.addLayout(btn_layout)
-        
-        load_group.setLayout(load_layout)
-        layout.addWidget(load_group)
-        
-        # Custom voice commands section SECOND
-        custom_voice_group = QGroupBox("Custom Voice Commands (Auto-Learn)")
-        custom_voice_layout = QVBoxLayout()
-        
-        custom_voice_btn_layout = QHBoxLayout()
-        
-        add_voice_btn = QPushButton("➕ Add Custom Voice Command")
-        add_voice_btn.clicked.connect(self._add_custom_voice)
-        custom_voice_btn_layout.addWidget(add_voice_btn)
-        
-        remove_voice_btn = QPushButton("➖ Remove Custom Voice")
-        remove_voice_btn.clicked.connect(self._remove_custom_voice)
-        custom_voice_btn_layout.addWidget(remove_voice_btn)
-        
-        custom_voice_layout.addLayout(custom_voice_btn_layout)
-        
-        self.custom_voice_list = QListWidget()
-        custom_voice_layout.addWidget(self.custom_voice_list)
-        
-        custom_voice_group.setLayout(custom_voice_layout)
-        layout.addWidget(custom_voice_group)
-        
-        # Current model section (remains at bottom)
-        current_group = QGroupBox("Current Voice Model Mapping")
-        current_layout = QVBoxLayout()
-        
-        self.voice_model_label = QLabel("No model loaded")
-        current_layout.addWidget(self.voice_model_label)
-        
-        self.voice_table = QTableWidget()
-        self.voice_table.setColumnCount(4)  # Changed from 3 to 4
-        self.voice_table.setHorizontalHeaderLabels(["Class Name", "Assigned Letter", "Edit", "Delete"])
-        self.voice_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.voice_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.voice_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.voice_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        current_layout.addWidget(self.voice_table)
+    def _create_tab(self, kind):
+        """
+        Create the configuration tab for one model kind.
         
-        save_btn = QPushButton("Save Mapping")
-        save_btn.clicked.connect(lambda: self._save_mapping("voice"))
-        current_layout.addWidget(save_btn)
-        
-        current_group.setLayout(current_layout)
-        layout.addWidget(current_group)
-        
-        # Load current mapping
-        self._load_voice_mapping()
-        self._refresh_custom_voices()
-        
-        widget.setLayout(layout)
-        return widget
-    
-    def _create_gesture_tab(self):
-        """Create gesture model configuration tab."""
+        Args:
+            kind: "voice" or "gesture"
+            
+        Returns:
+            Tab widget; its model, view, label and list go in self._tables[kind]
+        """
+        text = self._TAB_TEXT[kind]
         widget = QWidget()
         layout = QVBoxLayout()
         
         # Load new model section
-        load_group = QGroupBox("Load New Gesture Model")
+        load_group = QGroupBox(f"Load New {kind.capitalize()} Model")
         load_layout = QVBoxLayout()
         
         btn_layout = QHBoxLayout()
-        self.gesture_load_btn = QPushButton("Load .tflite and labels.txt")
-        self.gesture_load_btn.clicked.connect(lambda: self._load_new_model("gesture"))
-        btn_layout.addWidget(self.gesture_load_btn)
+        load_btn = QPushButton("Load .tflite and labels.txt")
+        load_btn.clicked.connect(lambda: self._load_new_model(kind))
+        btn_layout.addWidget(load_btn)
         load_layout.addLayout(btn_layout)
         
         load_group.setLayout(load_layout)
         layout.addWidget(load_group)
         
-        # Custom gestures section
-        custom_group = QGroupBox("Custom Gestures (Auto-Learn)")
+        # Custom commands section
+        custom_group = QGroupBox(text["custom_title"])
         custom_layout = QVBoxLayout()
         
         custom_btn_layout = QHBoxLayout()
         
-        add_custom_btn = QPushButton("➕ Add Custom Gesture")
-        add_custom_btn.clicked.connect(self._add_custom_gesture)
+        add_custom_btn = QPushButton(text["add"])
+        add_custom_btn.clicked.connect(getattr(self, f"_add_custom_{kind}"))
         custom_btn_layout.addWidget(add_custom_btn)
         
-        remove_custom_btn = QPushButton("➖ Remove Custom Gesture")
-        remove_custom_btn.clicked.connect(self._remove_custom_gesture)
+        remove_custom_btn = QPushButton(text["remove"])
+        remove_custom_btn.clicked.connect(getattr(self, f"_remove_custom_{kind}"))
         custom_btn_layout.addWidget(remove_custom_btn)
         
         custom_layout.addLayout(custom_btn_layout)
         
-        self.custom_gesture_list = QListWidget()
-        custom_layout.addWidget(self.custom_gesture_list)
+        custom_list = QListWidget()
+        custom_layout.addWidget(custom_list)
         
         custom_group.setLayout(custom_layout)
         layout.addWidget(custom_group)
         
         # Current model section
-        current_group = QGroupBox("Current Gesture Model Mapping")
+        current_group = QGroupBox(f"Current {kind.capitalize()} Model Mapping")
         current_layout = QVBoxLayout()
         
-        self.gesture_model_label = QLabel("No model loaded")
-        current_layout.addWidget(self.gesture_model_label)
-        
-        self.gesture_table = QTableWidget()
-        self.gesture_table.setColumnCount(4)  # Changed from 3 to 4
-        self.gesture_table.setHorizontalHeaderLabels(["Class Name", "Assigned Letter", "Edit", "Delete"])
-        self.gesture_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.gesture_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.gesture_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.gesture_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        current_layout.addWidget(self.gesture_table)
-
+        model_label = QLabel("No model loaded")
+        current_layout.addWidget(model_label)
+        
+        mapping_model = MappingTableModel(self)
+        view = QTableView()
+        view.setModel(mapping_model)
+        view.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        view.horizontalHeader().setSectionResizeMode(1, QHeaderView.Interactive)
+        view.setColumnWidth(1, 80)
+        current_layout.addWidget(view)
+        
         save_btn = QPushButton("Save Mapping")
-        save_btn.clicked.connect(lambda: self._save_mapping("gesture"))
+        save_btn.clicked.connect(lambda: self._save_mapping(kind))
         current_layout.addWidget(save_btn)
         
         current_group.setLayout(current_layout)
         layout.addWidget(current_group)
         
+        self._tables[kind] = {
+            'model': mapping_model,
+            'view': view,
+            'label': model_label,
+            'list': custom_list,
+        }
+        
         # Load current mapping
-        self._load_gesture_mapping()
-        self._refresh_custom_gestures()
+        self._load_mapping(kind)
         
         widget.setLayout(layout)
         return widget
     
+    def _controller(self, kind):
+        """Return the backend controller for "voice" or "gesture"."""
+        return getattr(self.backend, f"{kind}_controller")
+    
+    def _saved_letters(self, kind):
+        """Return the letters assigned in the controller's saved mapping."""
+        mapping = self._controller(kind).get_current_mapping()
+        return frozenset(letter for letter in mapping.values() if letter)
+    
+    def _custom_names(self, kind):
+        """Return the custom command names of a controller."""
+        controller = self._controller(kind)
+        if kind == "voice":
+            return controller.get_custom_voices()
+        return controller.get_custom_gestures()
+    
     def _load_new_model(self, model_type):
         """Load a new model with file dialogs."""
         # Select .tflite file
-        tflite_path, _ = QFileDialog.getOpenFileName(
-            self,
+        tflite_path = self._pick_file(
             f"Select {model_type.capitalize()} Model (.tflite)",
-            "",
             "TFLite Files (*.tflite)"
         )
         
@@ -193,10 +241,8 @@ class ModelConfigDialog(QDialog):
             return
         
         # Select labels.txt file
-        labels_path, _ = QFileDialog.getOpenFileName(
-            self,
+        labels_path = self._pick_file(
             "Select Labels File (labels.txt)",
-            "",
             "Text Files (*.txt)"
         )
         
@@ -234,21 +280,42 @@ class ModelConfigDialog(QDialog):
             self.model_manager.save_mapping(model_name, model_type, final_mapping)
             
             # Load model into controller
-            if model_type == "voice":
-                success = self.backend.voice_controller.load_new_model(model_name)
-                if success:
-                    self._load_voice_mapping()
-                    QMessageBox.information(self, "Success", f"Voice model '{model_name}' loaded successfully!")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to load voice model into controller.")
+            success = self._controller(model_type).load_new_model(model_name)
+            if success:
+                self._load_mapping(model_type)
+                QMessageBox.information(self, "Success",
+                                        f"{model_type.capitalize()} model '{model_name}' loaded successfully!")
             else:
-                success = self.backend.gesture_controller.load_new_model(model_name)
-                if success:
-                    self._load_gesture_mapping()
-                    self._refresh_custom_gestures()
-                    QMessageBox.information(self, "Success", f"Gesture model '{model_name}' loaded successfully!")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to load gesture model into controller.")
+                QMessageBox.warning(self, "Error", f"Failed to load {model_type} model into controller.")
+    
+    def _pick_file(self, title, file_filter):
+        """
+        Ask for a file to open, starting in the last folder used.
+        
+        Args:
+            title: Dialog title
+            file_filter: Name filter, e.g. "Text Files (*.txt)"
+            
+        Returns:
+            Selected path, or "" if cancelled
+        """
+        dialog = QFileDialog(self, title, self._last_model_dir, file_filter)
+        dialog.setFileMode(QFileDialog.ExistingFile)
+        # Skip per-entry icon lookups and symlink resolution; slow on large
+        # or network folders
+        dialog.setOptions(QFileDialog.DontUseCustomDirectoryIcons
+                          | QFileDialog.DontResolveSymlinks
+                          | QFileDialog.ReadOnly)
+        # Prefer the platform dialog, which does not stat every entry the
+        # way Qt's own widget-based dialog does
+        dialog.setOption(QFileDialog.DontUseNativeDialog, False)
+        
+        if not dialog.exec():
+            return ""
+        
+        path = dialog.selectedFiles()[0]
+        self._last_model_dir = os.path.dirname(path)
+        return path
     
     def _edit_mapping_dialog(self, labels, current_mapping, model_type):
         """Show dialog to edit class-to-letter mappings."""
@@ -269,7 +336,10 @@ class ModelConfigDialog(QDialog):
         table.setRowCount(len(labels))
         table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         
-        # Populate table
+        # Populate table with signals and repaints off, then refresh once
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
         for i, label in enumerate(labels):
             # Class name (read-only)
             class_item = QTableWidgetItem(label)
@@ -280,6 +350,8 @@ class ModelConfigDialog(QDialog):
             letter = current_mapping.get(label, label)
             letter_item = QTableWidgetItem(letter)
             table.setItem(i, 1, letter_item)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
         
         layout.addWidget(table)
         
@@ -344,125 +416,48 @@ class ModelConfigDialog(QDialog):
                 "Please choose different letters."
             )
     
-    def _load_voice_mapping(self):
-        """Load current voice model mapping into table."""
-        if not self.backend.voice_controller.model:
-            self.voice_model_label.setText("No model loaded")
-            self.voice_table.setRowCount(0)
-            return
-        
-        model_name = self.backend.voice_controller.current_model_name
-        self.voice_model_label.setText(f"Model: {model_name}")
-        
-        mapping = self.backend.voice_controller.get_current_mapping()
-        
-        # Get all classes (regular + custom)
-        regular_labels = self.backend.voice_controller.model.get_labels()
-        custom_voices = self.backend.voice_controller.get_custom_voices()
-        
-        all_labels = list(regular_labels) + [f"[CUSTOM] {v}" for v in custom_voices]
-        
-        self.voice_table.setRowCount(len(all_labels))
-        
-        for i, label in enumerate(all_labels):
-            # Class name
-            class_item = QTableWidgetItem(label)
-            class_item.setFlags(class_item.flags() & ~Qt.ItemIsEditable)
-            self.voice_table.setItem(i, 0, class_item)
-            
-            # Letter (editable)
-            letter = mapping.get(label, "")
-            letter_item = QTableWidgetItem(letter)
-            self.voice_table.setItem(i, 1, letter_item)
-            
-            # Edit button
-            edit_btn = QPushButton("✏️ Edit")
-            edit_btn.clicked.connect(lambda checked, row=i: self._edit_cell("voice", row))
-            self.voice_table.setCellWidget(i, 2, edit_btn)
-            
-            # Delete button
-            delete_btn = QPushButton("🗑️")
-            delete_btn.clicked.connect(lambda checked, row=i, lbl=label: self._delete_class("voice", lbl))
-            self.voice_table.setCellWidget(i, 3, delete_btn)
+    def _load_mapping(self, kind):
+        """Load the current model mapping and custom commands of one kind."""
+        table = self._tables[kind]
+        controller = self._controller(kind)
+        self._refresh_custom(kind)
         
-        # Refresh custom voices list
-        self._refresh_custom_voices()
-
-    def _load_gesture_mapping(self):
-        """Load current gesture model mapping into table."""
-        if not self.backend.gesture_controller.model:
-            self.gesture_model_label.setText("No model loaded")
-            self.gesture_table.setRowCount(0)
+        if not controller.model:
+            table['label'].setText("No model loaded")
+            table['model'].replace([])
             return
         
-        model_name = self.backend.gesture_controller.current_model_name
-        self.gesture_model_label.setText(f"Model: {model_name}")
+        table['label'].setText(f"Model: {controller.current_model_name}")
         
-        mapping = self.backend.gesture_controller.get_current_mapping()
+        mapping = controller.get_current_mapping()
         
         # Get all classes (regular + custom)
-        regular_labels = self.backend.gesture_controller.model.get_labels()
-        custom_gestures = self.backend.gesture_controller.get_custom_gestures()
-        
-        all_labels = list(regular_labels) + [f"[CUSTOM] {g}" for g in custom_gestures]
-        
-        self.gesture_table.setRowCount(len(all_labels))
-        
-        for i, label in enumerate(all_labels):
-            # Class name
-            class_item = QTableWidgetItem(label)
-            class_item.setFlags(class_item.flags() & ~Qt.ItemIsEditable)
-            self.gesture_table.setItem(i, 0, class_item)
-            
-            # Letter (editable)
-            letter = mapping.get(label, "")
-            letter_item = QTableWidgetItem(letter)
-            self.gesture_table.setItem(i, 1, letter_item)
-            
-            # Edit button
-            edit_btn = QPushButton("✏️ Edit")
-            edit_btn.clicked.connect(lambda checked, row=i: self._edit_cell("gesture", row))
-            self.gesture_table.setCellWidget(i, 2, edit_btn)
-            
-            # Delete button
-            delete_btn = QPushButton("🗑️")
-            delete_btn.clicked.connect(lambda checked, row=i, lbl=label: self._delete_class("gesture", lbl))
-            self.gesture_table.setCellWidget(i, 3, delete_btn)
-    def _edit_cell(self, model_type, row):
-        """Edit a specific mapping cell."""
-        if model_type == "voice":
-            table = self.voice_table
-        else:
-            table = self.gesture_table
+        regular_labels = controller.model.get_labels()
+        all_labels = list(regular_labels) + [f"[CUSTOM] {n}" for n in self._custom_names(kind)]
         
-        # Make cell editable temporarily
-        table.editItem(table.item(row, 1))
+        table['model'].replace([(label, mapping.get(label, "")) for label in all_labels])
+    
+    def _refresh_custom(self, kind):
+        """Refresh the custom command list of one kind."""
+        custom_list = self._tables[kind]['list']
+        custom_list.clear()
+        custom_list.addItems(self._custom_names(kind))
     
     def _save_mapping(self, model_type):
         """Save mapping from table."""
-        if model_type == "voice":
-            table = self.voice_table
-            controller = self.backend.voice_controller
-        else:
-            table = self.gesture_table
-            controller = self.backend.gesture_controller
+        mapping_model = self._tables[model_type]['model']
+        controller = self._controller(model_type)
         
         if not controller.model:
             QMessageBox.warning(self, "No Model", "No model loaded.")
             return
         
-        # Extract mapping from table
-        mapping = {}
-        
-        for i in range(table.rowCount()):
-            class_name = table.item(i, 0).text()
-            letter = table.item(i, 1).text().strip()
-            mapping[class_name] = letter
-        
-        # Validate
-        is_valid, dup_letter, dup_classes = self.model_manager.validate_mapping(mapping)
+        # Validate (the model tracks letter counts as cells are edited)
+        duplicates = mapping_model.duplicates()
         
-        if not is_valid:
+        if duplicates:
+            dup_letter = duplicates[0]
+            dup_classes = mapping_model.classes_for(dup_letter)
             QMessageBox.warning(
                 self,
                 "Duplicate Letter",
@@ -473,15 +468,12 @@ class ModelConfigDialog(QDialog):
             return
         
         # Save
-        success = controller.update_mapping(mapping)
+        success = controller.update_mapping(mapping_model.mapping())
         
         if success:
             QMessageBox.information(self, "Success", "Mapping saved successfully!")
-            # Refresh the lists to show updated info
-            if model_type == "voice":
-                self._refresh_custom_voices()
-            else:
-                self._refresh_custom_gestures()
+            # Refresh the list to show updated info
+            self._refresh_custom(model_type)
         else:
             QMessageBox.critical(self, "Error", "Failed to save mapping.")
     
@@ -496,7 +488,7 @@ class ModelConfigDialog(QDialog):
             return
         
         # Get existing letters
-        existing_letters = set(controller.get_current_mapping().values())
+        existing_letters = self._saved_letters("gesture")
         model_path = controller.model.model_dir + f"/{controller.current_model_name}.tflite"
         
         dialog = CustomGestureDialog(controller.camera, model_path, existing_letters, self)
@@ -504,14 +496,13 @@ class ModelConfigDialog(QDialog):
         if dialog.exec() == QDialog.Accepted:
             data = dialog.get_gesture_data()
             controller.add_custom_gesture(data['name'], data['embeddings'], data['letter'])
-            self._refresh_custom_gestures()
-            self._load_gesture_mapping()
+            self._load_mapping("gesture")
             QMessageBox.information(self, "Success", 
                                   f"Custom gesture '{data['name']}' added successfully!")
     
     def _remove_custom_gesture(self):
         """Remove selected custom gesture."""
-        current_item = self.custom_gesture_list.currentItem()
+        current_item = self._tables["gesture"]['list'].currentItem()
         if not current_item:
             QMessageBox.warning(self, "No Selection", "Please select a custom gesture to remove.")
             return
@@ -526,15 +517,8 @@ class ModelConfigDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             self.backend.gesture_controller.remove_custom_gesture(gesture_name)
-            self._refresh_custom_gestures()
-            self._load_gesture_mapping()
+            self._load_mapping("gesture")
     
-    def _refresh_custom_gestures(self):
-        """Refresh custom gesture list."""
-        self.custom_gesture_list.clear()
-        gestures = self.backend.gesture_controller.get_custom_gestures()
-        for gesture in gestures:
-            self.custom_gesture_list.addItem(gesture)
     def _add_custom_voice(self):
         """Open dialog to add custom voice command."""
         from .custom_voice_dialog import CustomVoiceDialog
@@ -547,7 +531,7 @@ class ModelConfigDialog(QDialog):
             return
         
         # Get existing letters
-        existing_letters = set(controller.get_current_mapping().values())
+        existing_letters = self._saved_letters("voice")
         
         # Get existing custom voice names
         existing_names = controller.get_custom_voices()
@@ -557,14 +541,13 @@ class ModelConfigDialog(QDialog):
         if dialog.exec() == QDialog.Accepted:
             data = dialog.get_voice_data()
             controller.add_custom_voice(data['name'], data['embeddings'], data['letter'])
-            self._refresh_custom_voices()
-            self._load_voice_mapping()
+            self._load_mapping("voice")
             QMessageBox.information(self, "Success", 
                                   f"Custom voice command '{data['name']}' added successfully!")
     
     def _remove_custom_voice(self):
         """Remove selected custom voice command."""
-        current_item = self.custom_voice_list.currentItem()
+        current_item = self._tables["voice"]['list'].currentItem()
         if not current_item:
             QMessageBox.warning(self, "No Selection", "Please select a custom voice command to remove.")
             return
@@ -579,13 +562,4 @@ class ModelConfigDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             self.backend.voice_controller.remove_custom_voice(voice_name)
-            self._refresh_custom_voices()
-            self._load_voice_mapping()
-    
-    def _refresh_custom_voices(self):
-        """Refresh custom voice commands list."""
-        self.custom_voice_list.clear()
-        voices = self.backend.voice_controller.get_custom_voices()
-        for voice in voices:
-            self.custom_voice_list.addItem(voice)
-    
\ No newline at end of file
+            self._load_mapping("voice")
@@ -2,15 +2,90 @@
 Qt signal emitter for thread-safe UI updates.
 """
 
-from PySide6.QtCore import QObject, Signal
+import cv2
+import numpy as np
+from PySide6.QtCore import QObject, Signal, Slot, QMutex, QMetaObject, Qt
+from PySide6.QtGui import QImage
+
+from config import VIDEO_WIDTH, VIDEO_HEIGHT
 
 
 class SignalEmitter(QObject):
     """Qt signal emitter for thread-safe UI updates between threads."""
     
     log_signal = Signal(str, str)  # message, level
-    frame_signal = Signal(object)  # video frame
+    frame_signal = Signal(QImage)  # display-ready video frame, null to clear (see emit_frame)
     mode_signal = Signal(str)  # control mode
     status_signal = Signal(str)  # connection status
     voice_command_signal = Signal(str, float)  # command, confidence
-    gesture_command_signal = Signal(str, float)  # gesture, confidence
\ No newline at end of file
+    gesture_command_signal = Signal(str, float)  # gesture, confidence
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._frame_mutex = QMutex()
+        self._pending_frame = None
+        self._frame_scheduled = False
+        
+        # Conversion buffers, owned by the producer thread calling emit_frame
+        self._src_shape = None
+        self._scaled_buf = None
+    
+    def emit_frame(self, frame):
+        """
+        Queue a video frame for frame_signal from any thread.
+        
+        The frame is scaled and wrapped in a QImage here, on the calling
+        thread, so the GUI thread only has to paint it. Only the newest
+        frame is kept: if the GUI thread has not picked up the previous one
+        yet, it is replaced instead of queueing another.
+        
+        Args:
+            frame: OpenCV BGR frame or None to clear the display
+        """
+        image = QImage() if frame is None else self._to_qimage(frame)
+        
+        self._frame_mutex.lock()
+        self._pending_frame = image
+        schedule = not self._frame_scheduled
+        self._frame_scheduled = True
+        self._frame_mutex.unlock()
+        
+        if schedule:
+            QMetaObject.invokeMethod(self, "_drain_frame", Qt.QueuedConnection)
+    
+    @Slot()
+    def _drain_frame(self):
+        """Emit the newest pending frame (runs on the GUI thread)."""
+        self._frame_mutex.lock()
+        frame = self._pending_frame
+        self._pending_frame = None
+        self._frame_scheduled = False
+        self._frame_mutex.unlock()
+        
+        self.frame_signal.emit(frame)
+    
+    def _to_qimage(self, frame):
+        """
+        Scale a frame to fit the video display and wrap it in a QImage.
+        
+        Args:
+            frame: OpenCV BGR frame
+            
+        Returns:
+            QImage that owns its pixels
+        """
+        if frame.shape != self._src_shape:
+            height, width = frame.shape[:2]
+            scale = min(VIDEO_WIDTH / width, VIDEO_HEIGHT / height)
+            fit_w = max(1, round(width * scale))
+            fit_h = max(1, round(height * scale))
+            self._scaled_buf = np.empty((fit_h, fit_w, 3), dtype=np.uint8)
+            self._src_shape = frame.shape
+        
+        # Scale once in OpenCV (keeps aspect ratio); shown as BGR, no conversion
+        fit_h, fit_w = self._scaled_buf.shape[:2]
+        cv2.resize(frame, (fit_w, fit_h), dst=self._scaled_buf, interpolation=cv2.INTER_AREA)
+        
+        # copy() detaches the image from the buffer reused for the next frame
+        return QImage(self._scaled_buf.data, fit_w, fit_h,
+                      self._scaled_buf.strides[0], QImage.Format_BGR888).copy()
\ No newline at end of file
@@ -2,12 +2,13 @@
 Video display widget for camera feed.
 """
 
-import cv2
+import time
+
 from PySide6.QtWidgets import QLabel, QGroupBox, QVBoxLayout
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QPixmap
 
-from config import VIDEO_WIDTH, VIDEO_HEIGHT
+from config import VIDEO_WIDTH, VIDEO_HEIGHT, VIDEO_DISPLAY_FPS
 
 
 class VideoDisplay(QGroupBox):
@@ -15,6 +16,13 @@ class VideoDisplay(QGroupBox):
     
     def __init__(self, parent=None):
             super().__init__("📹 Live Camera Feed (Gesture Mode)     ", parent)
+            self._last_ts = 0.0  # time.monotonic() of the last frame shown
+            # Slack so frames paced at the same rate aren't dropped for arriving a bit early
+            self._min_interval = 0.8 / VIDEO_DISPLAY_FPS
+            self._pending = None  # Newest frame held back by the rate cap
+            self._paint_timer = QTimer(self)
+            self._paint_timer.setSingleShot(True)
+            self._paint_timer.timeout.connect(self._show_pending)
             self._init_ui()
     
     def _init_ui(self):
@@ -34,26 +42,43 @@ class VideoDisplay(QGroupBox):
         layout.addWidget(self.video_label)
         self.setLayout(layout)
     
-    def update_frame(self, frame):
+    def update_frame(self, image):
             """
             Update video display with new frame.
             
             Args:
-                frame: OpenCV BGR frame or None to clear
+                image: QImage already scaled to fit (see SignalEmitter.emit_frame),
+                       or a null QImage to clear
             """
-            if frame is None:
+            if image.isNull():
                 # Clear the display
                 self.video_label.clear()
                 self.video_label.setText("Waiting for camera...")
+                self._paint_timer.stop()
+                self._pending = None
+                self._last_ts = 0.0
                 return
             
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            height, width, _ = frame_rgb.shape
-            bytes_per_line = 3 * width
-            
-            q_img = QImage(frame_rgb.data, width, height, bytes_per_line, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(q_img)
-            scaled = pixmap.scaled(self.video_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # Hold frames arriving faster than the display rate; the newest
+            # one is painted when the interval is up so it is never lost
+            wait = self._last_ts + self._min_interval - time.monotonic()
+            if wait > 0:
+                self._pending = image
+                if not self._paint_timer.isActive():
+                    self._paint_timer.start(max(1, int(wait * 1000)))
+                return
             
-            self.video_label.setPixmap(scaled)
\ No newline at end of file
+            self._show(image)
+    
+    def _show_pending(self):
+        """Paint the frame held back by the rate cap."""
+        image, self._pending = self._pending, None
+        if image is not None:
+            self._show(image)
+    
+    def _show(self, image):
+        """Paint a frame and note when it was shown."""
+        self._paint_timer.stop()  # Anything held back is older than this frame
+        self._pending = None
+        self._last_ts = time.monotonic()
+        self.video_label.setPixmap(QPixmap.fromImage(image))
@@ -5,5 +5,6 @@ Utility modules for the robot controller.
 from .camera import find_camera
 from .resource_loader import resource_path
 from .logger import LogLevel
+from .tflite_compat import get_tflite_interpreter
 
-__all__ = ['find_camera', 'resource_path', 'LogLevel']
\ No newline at end of file
+__all__ = ['find_camera', 'resource_path', 'LogLevel', 'get_tflite_interpreter']
\ No newline at end of file
@@ -2,22 +2,58 @@
 Camera utility functions.
 """
 
+import os
+import sys
+
 import cv2
 
 
-def find_camera(max_tries=5):
+# Index of the camera found last time, tried first on the next call
+_last_index = None
+
+
+def _default_backend():
+    """Capture backend for this platform (skips OpenCV's backend probing)."""
+    if sys.platform.startswith("linux"):
+        return cv2.CAP_V4L2
+    if sys.platform == "win32":
+        return cv2.CAP_DSHOW
+    return cv2.CAP_ANY
+
+
+def find_camera(max_tries=5, backend=None):
     """
     Auto-detect available camera.
-    
+
+    The CAMERA_INDEX environment variable, if set, and the last camera
+    found are tried before probing indices in order.
+
     Args:
         max_tries: Maximum number of camera indices to try
-        
+        backend: OpenCV capture backend (cv2.CAP_*), or None for the platform default
+
     Returns:
         cv2.VideoCapture object or None if no camera found
     """
-    for i in range(max_tries):
-        cap = cv2.VideoCapture(i)
+    global _last_index
+
+    if backend is None:
+        backend = _default_backend()
+
+    preferred = []
+    env_index = os.environ.get("CAMERA_INDEX", "")
+    if env_index.isdigit():
+        preferred.append(int(env_index))
+    if _last_index is not None:
+        preferred.append(_last_index)
+    indices = dict.fromkeys(preferred + list(range(max_tries)))  # Ordered, no repeats
+
+    for i in indices:
+        cap = cv2.VideoCapture(i, backend)
         if cap.isOpened():
+            # Keep at most one queued frame so reads stay current
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            _last_index = i
             return cap
         cap.release()
-    return None
\ No newline at end of file
+    return None
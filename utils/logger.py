@@ -13,20 +13,24 @@ class LogLevel(Enum):
     INFO = "info"
 
 
+# Keyed by both LogLevel and its string value (log_signal carries strings)
+_LOG_COLORS = {
+    LogLevel.ERROR: "#ff4444",
+    LogLevel.WARNING: "#ffaa00",
+    LogLevel.SUCCESS: "#00ff88",
+    LogLevel.INFO: "#ffffff"
+}
+_LOG_COLORS.update({level.value: color for level, color in list(_LOG_COLORS.items())})
+
+
 def get_log_color(level):
     """
     Get HTML color code for log level.
     
     Args:
-        level: LogLevel enum value
+        level: LogLevel enum value or its string value (e.g. "error")
         
     Returns:
         HTML color code string
     """
-    colors = {
-        LogLevel.ERROR: "#ff4444",
-        LogLevel.WARNING: "#ffaa00",
-        LogLevel.SUCCESS: "#00ff88",
-        LogLevel.INFO: "#ffffff"
-    }
-    return colors.get(level, "#ffffff")
\ No newline at end of file
+    return _LOG_COLORS.get(level, "#ffffff")
\ No newline at end of file
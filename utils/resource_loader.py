@@ -4,8 +4,14 @@ Resource path resolution for PyInstaller compatibility.
 
 import os
 import sys
+from functools import lru_cache
 
 
+# PyInstaller unpacks to a temp folder and stores its path in _MEIPASS
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+
+@lru_cache(maxsize=256)
 def resource_path(relative_path):
     """
     Get absolute path to resource, works for dev and for PyInstaller.
@@ -16,10 +22,4 @@ def resource_path(relative_path):
     Returns:
         Absolute path to resource
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    
-    return os.path.join(base_path, relative_path)
\ No newline at end of file
+    return os.path.join(_BASE_PATH, relative_path)
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+TFLite interpreter loading with a TensorFlow fallback.
+"""
+
+import os
+from functools import lru_cache
+
+from config import TFLITE_XNNPACK_DELEGATE
+
+
+# Inference threads per interpreter; half the cores, leaving the rest for the UI and camera
+_DEFAULT_NUM_THREADS = max(1, (os.cpu_count() or 2) // 2)
+
+
+@lru_cache(maxsize=1)
+def _get_factory():
+    """
+    Find the TFLite interpreter class, probing once per process.
+
+    Returns:
+        Tuple of (Interpreter class, backend name)
+    """
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter, "tflite_runtime"
+    except ImportError:
+        pass
+
+    # Full TensorFlow is slow to import; only tried when tflite_runtime is missing
+    try:
+        import tensorflow as tf
+    except ImportError:
+        raise ImportError("Neither tflite_runtime nor tensorflow is installed")
+    return tf.lite.Interpreter, "tensorflow"
+
+
+@lru_cache(maxsize=1)
+def _get_xnnpack_delegate():
+    """
+    Load the XNNPACK delegate library configured in TFLITE_XNNPACK_DELEGATE,
+    once per process.
+
+    Returns:
+        Delegate object, or None if none is configured or it fails to load
+    """
+    # Stock tflite_runtime/TensorFlow builds apply XNNPACK by default
+    if not TFLITE_XNNPACK_DELEGATE:
+        return None
+
+    _, backend = _get_factory()
+    try:
+        if backend == "tflite_runtime":
+            from tflite_runtime.interpreter import load_delegate
+        else:
+            import tensorflow as tf
+            load_delegate = tf.lite.experimental.load_delegate
+        return load_delegate(TFLITE_XNNPACK_DELEGATE)
+    except (ImportError, ValueError, OSError) as e:
+        print(f"XNNPACK delegate '{TFLITE_XNNPACK_DELEGATE}' not loaded ({e}); using the default CPU kernels")
+        return None
+
+
+def get_tflite_interpreter(model_path, use_xnnpack=True, num_threads=None):
+    """
+    Create a TFLite interpreter for a model file.
+
+    Args:
+        model_path: Path to the .tflite model
+        use_xnnpack: Attach the configured XNNPACK delegate, if any
+        num_threads: Kernel threads, or None for half the CPU cores
+
+    Returns:
+        Interpreter instance (tensors not yet allocated)
+    """
+    interpreter_cls, _ = _get_factory()
+    if num_threads is None:
+        num_threads = _DEFAULT_NUM_THREADS
+    delegate = _get_xnnpack_delegate() if use_xnnpack else None
+    if delegate is not None:
+        return interpreter_cls(
+            model_path=model_path,
+            experimental_delegates=[delegate],
+            num_threads=num_threads,
+        )
+    return interpreter_cls(model_path=model_path, num_threads=num_threads)
+